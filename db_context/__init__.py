@@ -1,9 +1,10 @@
+import asyncio
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Tuple, Union
 
 from .database import DatabaseConnector
 from .schema.manager import SchemaManager
-from .models import TableInfo
+from .models import Column, Constraint, Index, TableInfo
 
 
 class DatabaseContext:
@@ -12,6 +13,8 @@ class DatabaseContext:
         self.schema_manager = SchemaManager(self.db_connector, cache_path)
         # Set the schema manager reference in the connector
         self.db_connector.set_schema_manager(self.schema_manager)
+        # Object cache fetches in flight, shared by callers missing the same entry
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
         
     async def initialize(self) -> None:
         """Initialize the database context, connection pool, and schema cache"""
@@ -20,7 +23,58 @@ class DatabaseContext:
         
     async def close(self) -> None:
         """Close the database context and connection pool"""
-        await self.db_connector.close_pool()
+        try:
+            await self.schema_manager.close()
+        finally:
+            await self.db_connector.close_pool()
+
+    async def __aenter__(self) -> "DatabaseContext":
+        try:
+            await self.initialize()
+        except BaseException:
+            # __aexit__ doesn't run when entering fails, so release the pool here
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+        
+    async def _cached_fetch(
+        self, cache_type: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return an object cache entry, fetching it from the database on a miss.
+
+        Concurrent misses on the same entry share one fetch instead of each
+        running the same dictionary query.
+        """
+        cached = self.schema_manager.get_cached(cache_type, key)
+        if cached is not None:
+            self.schema_manager.cache_stats['hits'] += 1
+            return cached
+
+        task = self._inflight.get((cache_type, key))
+        if task is None:
+            # If not in cache or expired, get from database
+            self.schema_manager.cache_stats['misses'] += 1
+            task = asyncio.create_task(self._fetch_into_cache(cache_type, key, fetch))
+            self._inflight[(cache_type, key)] = task
+        else:
+            self.schema_manager.cache_stats['hits'] += 1
+        # Shielded so a cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_into_cache(
+        self, cache_type: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Fetch an object cache entry, store it and persist the cache"""
+        try:
+            result = await fetch()
+            self.schema_manager.update_cache(cache_type, key, result)
+            await self.schema_manager.save_cache()
+            return result
+        finally:
+            self._inflight.pop((cache_type, key), None)
         
     async def get_database_info(self):
         """Get information about the database vendor and version"""
@@ -30,108 +84,81 @@ class DatabaseContext:
         """Get schema information for a specific table"""
         return await self.schema_manager.get_schema_info(table_name)
     
+    async def get_schema_info_many(self, table_names: List[str]) -> List[Union[Optional[TableInfo], BaseException]]:
+        """Get schema information for several tables, loading the missing ones in one batch"""
+        return await self.schema_manager.get_schema_info_many(table_names)
+    
     async def search_tables(self, search_term: str, limit: int = 20) -> List[str]:
         """Search for table names matching the search term"""
         return await self.schema_manager.search_tables(search_term, limit)
         
+    async def search_tables_multi(self, search_terms: List[str], limit: int = 20) -> List[str]:
+        """Search for table names matching any of several terms"""
+        return await self.schema_manager.search_tables_multi(search_terms, limit)
+        
+    async def prewarm(self, top_n: int = 200) -> int:
+        """Load the largest tables into the schema cache ahead of use"""
+        return await self.schema_manager.prewarm(top_n)
+        
     async def rebuild_cache(self) -> None:
         """Force a rebuild of the schema cache"""
-        self.schema_manager.cache = await self.schema_manager.load_or_build_cache(force_rebuild=True)
+        await self.schema_manager.rebuild_cache()
         
-    async def search_columns(self, search_term: str, limit: int = 50) -> Dict[str, List[Dict[str, Any]]]:
+    async def search_columns(self, search_term: str, limit: int = 50) -> Dict[str, List[Column]]:
         """Search for columns matching the given pattern across all tables"""
         return await self.schema_manager.search_columns(search_term, limit)
         
     async def get_pl_sql_objects(self, object_type: str, name_pattern: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get information about PL/SQL objects of the specified type"""
-        # First check schema manager cache
-        cache_key = f"{object_type}_{name_pattern or 'all'}"
-        if self.schema_manager.is_cache_valid('plsql', cache_key):
-            self.schema_manager.cache_stats['hits'] += 1
-            return self.schema_manager.object_cache['plsql'][cache_key]['data']
-        
-        # If not in cache or expired, get from database
-        self.schema_manager.cache_stats['misses'] += 1
-        result = await self.db_connector.get_pl_sql_objects(object_type, name_pattern)
-        
-        # Update cache
-        self.schema_manager.update_cache('plsql', cache_key, result)
-        await self.schema_manager.save_cache()
-        return result
+        cache_key = self.schema_manager.plsql_cache_key(object_type, name_pattern)
+        return await self._cached_fetch(
+            'plsql', cache_key,
+            lambda: self.db_connector.get_pl_sql_objects(object_type, name_pattern),
+        )
         
     async def get_object_source(self, object_type: str, object_name: str) -> str:
         """Get the source code for a PL/SQL object"""
         return await self.db_connector.get_object_source(object_type, object_name)
         
-    async def get_table_constraints(self, table_name: str) -> List[Dict[str, Any]]:
-        """Get constraints for a specific table"""
-        # Check cache first
-        if self.schema_manager.is_cache_valid('constraints', table_name):
-            self.schema_manager.cache_stats['hits'] += 1
-            return self.schema_manager.object_cache['constraints'][table_name]['data']
+    async def get_objects_source(self, object_type: str, object_names: List[str]) -> Dict[str, str]:
+        """Get the source code for several PL/SQL objects of the same type"""
+        return await self.db_connector.get_objects_source(object_type, object_names)
         
-        # If not in cache or expired, get from database
-        self.schema_manager.cache_stats['misses'] += 1
-        result = await self.db_connector.get_table_constraints(table_name)
-        
-        # Update cache
-        self.schema_manager.update_cache('constraints', table_name, result)
-        await self.schema_manager.save_cache()
-        return result
+    async def get_table_constraints(self, table_name: str) -> List[Constraint]:
+        """Get constraints for a specific table"""
+        return await self._cached_fetch(
+            'constraints', table_name,
+            lambda: self.db_connector.get_table_constraints(table_name),
+        )
         
-    async def get_table_indexes(self, table_name: str) -> List[Dict[str, Any]]:
+    async def get_table_indexes(self, table_name: str) -> List[Index]:
         """Get indexes for a specific table"""
-        # Check cache first
-        if self.schema_manager.is_cache_valid('indexes', table_name):
-            self.schema_manager.cache_stats['hits'] += 1
-            return self.schema_manager.object_cache['indexes'][table_name]['data']
-        
-        # If not in cache or expired, get from database
-        self.schema_manager.cache_stats['misses'] += 1
-        result = await self.db_connector.get_table_indexes(table_name)
-        
-        # Update cache
-        self.schema_manager.update_cache('indexes', table_name, result)
-        await self.schema_manager.save_cache()
-        return result
+        return await self._cached_fetch(
+            'indexes', table_name,
+            lambda: self.db_connector.get_table_indexes(table_name),
+        )
         
     async def get_dependent_objects(self, object_name: str) -> List[Dict[str, Any]]:
         """Get objects that depend on the specified object"""
         return await self.db_connector.get_dependent_objects(object_name)
         
+    async def get_dependents_with_details(self, object_name: str) -> List[Dict[str, Any]]:
+        """Get dependent objects together with their column details"""
+        return await self.db_connector.get_dependents_with_details(object_name)
+        
     async def get_user_defined_types(self, type_pattern: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get information about user-defined types"""
-        # Check cache first
-        cache_key = type_pattern or 'all'
-        if self.schema_manager.is_cache_valid('types', cache_key):
-            self.schema_manager.cache_stats['hits'] += 1
-            return self.schema_manager.object_cache['types'][cache_key]['data']
-        
-        # If not in cache or expired, get from database
-        self.schema_manager.cache_stats['misses'] += 1
-        result = await self.db_connector.get_user_defined_types(type_pattern)
-        
-        # Update cache
-        self.schema_manager.update_cache('types', cache_key, result)
-        await self.schema_manager.save_cache()
-        return result
+        return await self._cached_fetch(
+            'types', type_pattern or 'all',
+            lambda: self.db_connector.get_user_defined_types(type_pattern),
+        )
 
     async def get_related_tables(self, table_name: str) -> Dict[str, List[str]]:
         """Get all tables that are related to the specified table through foreign keys."""
-        # Check cache first
-        cache_key = f"related_{table_name}"
-        if self.schema_manager.is_cache_valid('related_tables', cache_key):
-            self.schema_manager.cache_stats['hits'] += 1
-            return self.schema_manager.object_cache['related_tables'][cache_key]['data']
-        
-        # If not in cache or expired, get from database
-        self.schema_manager.cache_stats['misses'] += 1
-        result = await self.db_connector.get_related_tables(table_name)
-        
-        # Update cache
-        self.schema_manager.update_cache('related_tables', cache_key, result)
-        await self.schema_manager.save_cache()
-        return result
+        return await self._cached_fetch(
+            'related_tables', f"related_{table_name}",
+            lambda: self.db_connector.get_related_tables(table_name),
+        )
 
     async def run_sql_query(self, sql: str, params: Optional[Dict[str, Any]] = None, max_rows: int = 100) -> Dict[str, Any]:
         """Runs a SQL query and returns the results."""
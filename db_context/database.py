@@ -1,11 +1,208 @@
+import io
+import re
 import sys
 import oracledb
-import sqlparse
 import time
 import asyncio
-from typing import Dict, List, Set, Optional, Any
+from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from typing import Callable, Dict, Iterable, List, Set, Optional, Any, Tuple
 from pathlib import Path
-from .models import SchemaManager
+from types import MappingProxyType
+from .utils import canonical_name
+from .models import Column, Constraint, ConstraintReference, Index, SchemaManager
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+SOURCE_FETCH_ARRAYSIZE = 5000  # Rows per round-trip when streaming all_source
+TABLE_NAME_FETCH_ARRAYSIZE = 5000  # Rows per round-trip when listing tables
+MAX_ROWS_FETCH_ARRAYSIZE = 1000  # Cap on the arraysize sized to a max_rows fetch
+STATEMENT_CACHE_SIZE = 50  # Statements cached per pooled session
+# Tables loaded at once from which one bulk query beats per-table queries
+BULK_DETAILS_MIN_TABLES = 4
+# Pooled sessions shared by every tool call; POOL_MAX matches the schema
+# manager's PREFETCH_CONCURRENCY so a full prefetch never waits for a session
+POOL_MIN = 2
+POOL_MAX = 16
+POOL_INCREMENT = 2
+# all_tab_columns type with its length/precision, e.g. VARCHAR2(100) or
+# NUMBER(10,2); every query that returns column types selects this, so cached
+# and freshly queried columns read the same
+COLUMN_TYPE_SQL = """
+    CASE
+        WHEN data_type = 'NUMBER' AND data_precision IS NULL THEN 'NUMBER'
+        WHEN data_type = 'NUMBER' AND data_precision IS NOT NULL THEN
+            'NUMBER(' || data_precision ||
+            CASE
+                WHEN data_scale IS NOT NULL AND data_scale != 0
+                    THEN ',' || data_scale
+                ELSE ''
+                END || ')'
+        WHEN data_type = 'VARCHAR2' THEN data_type || '(' || data_length || ')'
+        WHEN data_type = 'CHAR' THEN data_type || '(' || data_length || ')'
+        ELSE data_type
+        END"""
+# Descriptions for all_constraints.constraint_type codes
+CONSTRAINT_TYPE_NAMES = MappingProxyType(
+    {"P": "PRIMARY KEY", "R": "FOREIGN KEY", "U": "UNIQUE", "C": "CHECK"}
+)
+# Object types whose source text is stored line by line in all_source
+ALL_SOURCE_OBJECT_TYPES = frozenset(
+    {
+        "PROCEDURE",
+        "FUNCTION",
+        "PACKAGE",
+        "PACKAGE BODY",
+        "TYPE",
+        "TYPE BODY",
+        "TRIGGER",
+    }
+)
+# Object types whose source tools read from all_source; the other types are
+# returned as the DDL dbms_metadata.get_ddl generates for them
+SOURCE_TEXT_OBJECT_TYPES = frozenset({"PACKAGE", "PACKAGE BODY", "TYPE", "TYPE BODY"})
+# Leading keywords of statements that only read, and of statements that write
+READ_ONLY_KEYWORDS = frozenset({"SELECT", "WITH", "EXPLAIN", "DESCRIBE", "SHOW"})
+WRITE_KEYWORDS = frozenset(
+    {
+        "INSERT",
+        "UPDATE",
+        "DELETE",
+        "MERGE",
+        "CREATE",
+        "ALTER",
+        "DROP",
+        "TRUNCATE",
+        "GRANT",
+        "REVOKE",
+        "REPLACE",
+    }
+)
+# Leading whitespace and comments, then a first word standing on its own (not
+# a function call or a "name ." qualifier, which sqlparse reads as names). The
+# comment patterns can only end at the first line break or "*/", so the match
+# can't backtrack into treating comment text as the statement.
+_LEADING_KEYWORD_RE = re.compile(
+    r"(?:\s+|--[^\r\n]*(?:[\r\n]|\Z)|/\*[^*]*\*+(?:[^*/][^*]*\*+)*/)*"
+    r"([A-Za-z]+)(?=\s|\Z)(?!\s*\.)"
+)
+# A GO batch separator (matched against lower-cased text), which sqlparse
+# splits statements on like ";"
+_GO_SEPARATOR_RE = re.compile(r"(?<![a-z])go(?![a-z])")
+# Object types the PL/SQL object tools accept; anything else is rejected
+# before a query is run
+SUPPORTED_OBJECT_TYPES = ALL_SOURCE_OBJECT_TYPES | {
+    "VIEW",
+    "MATERIALIZED VIEW",
+    "SEQUENCE",
+    "SYNONYM",
+}
+
+
+def _leading_keyword(sql: str) -> Optional[str]:
+    """Return the upper-cased first keyword of a plain single statement.
+
+    Covers the common case without tokenizing the whole statement with
+    sqlparse: nothing sqlparse could split on (other than a trailing
+    semicolon), and a first word followed by whitespace. Returns None for
+    anything else, which the classifiers then hand to sqlparse.
+    """
+    # Substring checks first: a case-insensitive regex scan of the whole
+    # statement costs several times more than the rest of the fast path.
+    # A single ";" ending the text can't start a second statement.
+    semicolon = sql.find(";")
+    if semicolon != -1 and sql[semicolon + 1 :].strip():
+        return None
+    lowered = sql.lower()
+    if "go" in lowered and _GO_SEPARATOR_RE.search(lowered):
+        return None
+    match = _LEADING_KEYWORD_RE.match(sql)
+    return match.group(1).upper() if match else None
+
+
+@lru_cache(maxsize=1024)
+def _classify_statement(sql: str) -> Tuple[bool, bool]:
+    """Classify a statement as (is_select, is_write), backing both predicates.
+
+    Only the two flags are cached, never the parsed statement. A statement run
+    through execute_sql_query is classified up to three times, and the same
+    statements tend to be issued repeatedly, so each is classified once.
+    """
+    keyword = _leading_keyword(sql)
+    if keyword in READ_ONLY_KEYWORDS:
+        return True, False
+    if keyword in WRITE_KEYWORDS:
+        return False, True
+    return _parse_classification(sql)
+
+
+def _parse_classification(sql: str) -> Tuple[bool, bool]:
+    """Classify a statement with sqlparse as (is_select, is_write)"""
+    # Imported on first use: the keyword fast path answers most statements,
+    # and sqlparse adds ~20 ms to startup
+    import sqlparse
+
+    if not sql.strip():
+        return False, False
+
+    # Stacked / multiple statements are neither
+    statements = sqlparse.parse(sql)
+    if len(statements) != 1:
+        return False, False
+
+    stmt = statements[0]
+    first_token = stmt.token_first(skip_cm=True)
+    if first_token is None:
+        return False, False
+
+    first_val = first_token.value.upper()
+
+    # Explicitly exclude read-only leading tokens before generic DML/DDL
+    # classification; read-only analysis style commands (EXPLAIN, DESCRIBE,
+    # SHOW) are treated as safe
+    if first_val in READ_ONLY_KEYWORDS:
+        return True, False
+
+    # Use sqlparse's statement type when available for robustness (handles CTEs)
+    try:
+        stmt_type = stmt.get_type()  # Often returns 'SELECT' for WITH/SELECT
+    except Exception:  # pragma: no cover - defensive
+        stmt_type = None
+
+    is_write = first_token.ttype in (
+        sqlparse.tokens.Keyword.DML,
+        sqlparse.tokens.Keyword.DDL,
+    ) or (first_token.ttype in sqlparse.tokens.Keyword and first_val in WRITE_KEYWORDS)
+    return stmt_type == "SELECT", is_write
+
+
+def _like_literal(term: str) -> str:
+    """Escape a term for LIKE ... ESCAPE '\\' so it only matches itself"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _plsql_object_info(
+    name: str,
+    obj_type: str,
+    status: str,
+    owner: str,
+    created: Optional[datetime],
+    last_modified: Optional[datetime],
+) -> Dict[str, Any]:
+    """Build the dictionary describing a single PL/SQL object row"""
+    obj_info = {"name": name, "type": obj_type, "status": status, "owner": owner}
+    if created:
+        obj_info["created"] = created.strftime(TIMESTAMP_FORMAT)
+    if last_modified:
+        obj_info["last_modified"] = last_modified.strftime(TIMESTAMP_FORMAT)
+    return obj_info
+
+
+def _plsql_rowfactory(owner: str) -> Callable[..., Dict[str, Any]]:
+    """Return a cursor rowfactory turning all_objects rows into object dicts"""
+    return lambda name, obj_type, status, created, last_modified: _plsql_object_info(
+        name, obj_type, status, owner, created, last_modified
+    )
 
 
 class DatabaseConnector:
@@ -36,6 +233,10 @@ class DatabaseConnector:
         self._pool = None
         self._pool_lock = asyncio.Lock()
         self._oracle_version = None  # Cache for Oracle version detection
+        # Vendor/version details don't change while the server runs; the lock
+        # makes concurrent first callers share one lookup
+        self._database_info: Optional[Dict[str, Any]] = None
+        self._database_info_lock = asyncio.Lock()
 
         if self.thick_mode:
             try:
@@ -135,18 +336,20 @@ class DatabaseConnector:
                     if self.thick_mode:
                         self._pool = oracledb.create_pool(
                             self.connection_string,
-                            min=2,
-                            max=10,
-                            increment=1,
+                            min=POOL_MIN,
+                            max=POOL_MAX,
+                            increment=POOL_INCREMENT,
                             getmode=oracledb.POOL_GETMODE_WAIT,
+                            stmtcachesize=STATEMENT_CACHE_SIZE,
                         )
                     else:
                         self._pool = oracledb.create_pool_async(
                             self.connection_string,
-                            min=2,
-                            max=10,
-                            increment=1,
+                            min=POOL_MIN,
+                            max=POOL_MAX,
+                            increment=POOL_INCREMENT,
                             getmode=oracledb.POOL_GETMODE_WAIT,
+                            stmtcachesize=STATEMENT_CACHE_SIZE,
                         )
                     print("Database connection pool initialized", file=sys.stderr)
                 except oracledb.Error as e:
@@ -176,13 +379,19 @@ class DatabaseConnector:
                     raise
 
     async def get_connection(self):
-        """Get a connection from the pool"""
+        """Get a connection from the pool.
+
+        Thick mode has no asyncio API, so its blocking driver calls (here and
+        in the other helpers) run in a worker thread: waiting for a free
+        session must not stall the event loop, or the coroutines holding the
+        sessions could never release them.
+        """
         if self._pool is None:
             await self.initialize_pool()
 
         try:
             if self.thick_mode:
-                return self._pool.acquire()
+                return await asyncio.to_thread(self._pool.acquire)
             else:
                 return await self._pool.acquire()
         except oracledb.Error as e:
@@ -206,20 +415,20 @@ class DatabaseConnector:
         """Return connection to the pool"""
         try:
             if self.thick_mode:
-                self._pool.release(conn)
+                await asyncio.to_thread(self._pool.release, conn)
             else:
                 await self._pool.release(conn)
         except Exception as e:
             print(f"Error releasing connection to pool: {e}", file=sys.stderr)
 
     async def close_pool(self):
-        """Close the connection pool"""
+        """Close the connection pool, including connections still checked out"""
         if self._pool:
             try:
                 if self.thick_mode:
-                    self._pool.close()
+                    await asyncio.to_thread(self._pool.close, force=True)
                 else:
-                    await self._pool.close()
+                    await self._pool.close(force=True)
                 self._pool = None
                 print("Connection pool closed", file=sys.stderr)
             except Exception as e:
@@ -229,8 +438,24 @@ class DatabaseConnector:
         """Set the schema manager reference"""
         self.schema_manager = schema_manager
 
+    def _is_known_table(self, table_name: str) -> bool:
+        """Check a table name against the schema manager's cached table index.
+
+        Returns True when no index has been built yet, leaving the decision to
+        the caller's own query.
+        """
+        cache = self.schema_manager.cache if self.schema_manager else None
+        if cache is None or not cache.all_table_names:
+            return True
+        return table_name in cache.all_table_names
+
     async def _execute_cursor_fetch(
-        self, cursor, sql: str, max_rows: Optional[int] = None, **params
+        self,
+        cursor,
+        sql: str,
+        max_rows: Optional[int] = None,
+        cache_statement: bool = True,
+        **params,
     ):
         """Helper method to execute cursor operations and fetch results.
 
@@ -238,17 +463,29 @@ class DatabaseConnector:
             cursor: Database cursor
             sql: SQL query to execute
             max_rows: Maximum number of rows to fetch. If None, fetches all rows.
+                Otherwise the cursor fetches (and prefetches on execute) up
+                to max_rows rows at once, so a small result comes back with
+                the execute round-trip.
+            cache_statement: Whether to keep the statement in the session's
+                statement cache. Ad-hoc SQL is kept out so it doesn't evict
+                the dictionary queries that are run over and over.
             **params: Query parameters
 
         Returns:
             List of rows from the query result
         """
+        if not cache_statement:
+            cursor.prepare(sql, cache_statement=False)
+            sql = None
+        if max_rows is not None:
+            # One row more than asked lets the driver see the end of the
+            # result without another round-trip
+            cursor.arraysize = max(1, min(max_rows, MAX_ROWS_FETCH_ARRAYSIZE))
+            cursor.prefetchrows = cursor.arraysize + 1
         if self.thick_mode:
-            cursor.execute(sql, **params)
-            if max_rows is None:
-                return cursor.fetchall()
-            else:
-                return list(cursor.fetchmany(max_rows))
+            return await asyncio.to_thread(
+                self._execute_fetch_blocking, cursor, sql, max_rows, params
+            )
         else:
             await cursor.execute(sql, **params)
             if max_rows is None:
@@ -257,6 +494,16 @@ class DatabaseConnector:
                 rows = await cursor.fetchmany(max_rows)
                 return list(rows)
 
+    @staticmethod
+    def _execute_fetch_blocking(
+        cursor, sql: Optional[str], max_rows: Optional[int], params: Dict[str, Any]
+    ) -> List[Any]:
+        """Thick mode body of _execute_cursor_fetch, run in a worker thread"""
+        cursor.execute(sql, **params)
+        if max_rows is None:
+            return cursor.fetchall()
+        return list(cursor.fetchmany(max_rows))
+
     def _assert_query_executable(self, sql: str) -> None:
         """Check if a query can be executed based on read-only mode and query type."""
         if self.read_only and not self._is_select_query(sql):
@@ -269,11 +516,16 @@ class DatabaseConnector:
         if self.read_only:
             raise PermissionError("Read-only mode: write operations are disabled")
 
-    async def _execute_cursor_no_fetch(self, cursor, sql: str, **params):
+    async def _execute_cursor_no_fetch(
+        self, cursor, sql: str, cache_statement: bool = True, **params
+    ):
         """Helper method for statements that modify data (e.g. DELETE, UPDATE)."""
         self._assert_query_executable(sql)
+        if not cache_statement:
+            cursor.prepare(sql, cache_statement=False)
+            sql = None
         if self.thick_mode:
-            cursor.execute(sql, **params)
+            await asyncio.to_thread(cursor.execute, sql, **params)
         else:
             await cursor.execute(sql, **params)
 
@@ -281,7 +533,7 @@ class DatabaseConnector:
         """Commit the current transaction"""
         self._assert_write_allowed()
         if self.thick_mode:
-            conn.commit()
+            await asyncio.to_thread(conn.commit)
         else:
             await conn.commit()
 
@@ -300,7 +552,21 @@ class DatabaseConnector:
             await self._close_connection(conn)
 
     async def get_database_info(self) -> Dict[str, Any]:
-        """Get information about the database vendor and version"""
+        """Get information about the database vendor and version.
+
+        A successful result is cached for the lifetime of the connector, and
+        concurrent calls before that share a single lookup.
+        """
+        if self._database_info is not None:
+            return self._database_info
+
+        async with self._database_info_lock:
+            if self._database_info is None:
+                return await self._fetch_database_info()
+            return self._database_info
+
+    async def _fetch_database_info(self) -> Dict[str, Any]:
+        """Query the vendor and version details, caching a successful result"""
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
@@ -324,6 +590,7 @@ class DatabaseConnector:
                 if additional_info:
                     vendor_info["additional_info"] = additional_info
 
+                self._database_info = vendor_info
             return vendor_info
         except oracledb.Error as e:
             print(f"Error getting database info: {str(e)}", file=sys.stderr)
@@ -337,64 +604,146 @@ class DatabaseConnector:
         try:
             print("Getting list of all tables...", file=sys.stderr)
             cursor = conn.cursor()
+            cursor.arraysize = TABLE_NAME_FETCH_ARRAYSIZE
             schema = await self._get_effective_schema(conn)
             # Using RESULT_CACHE hint for frequently accessed data
-            all_tables = await self._execute_cursor_fetch(
-                cursor,
-                """
+            sql = """
                 SELECT /*+ RESULT_CACHE */ table_name
                 FROM all_tables
                 WHERE owner = :owner
                 ORDER BY table_name
-                """,
-                owner=schema,
-            )
+                """
+
+            # Build the set while iterating so the full row list is never held.
+            # Names are interned as they're shared by every cache structure.
+            names: Set[str] = set()
+            if self.thick_mode:
+
+                def collect() -> None:
+                    cursor.execute(sql, owner=schema)
+                    for (name,) in cursor:
+                        names.add(sys.intern(name))
+
+                await asyncio.to_thread(collect)
+            else:
+                await cursor.execute(sql, owner=schema)
+                async for (name,) in cursor:
+                    names.add(sys.intern(name))
 
-            return {t[0] for t in all_tables}
+            return names
         finally:
             await self._close_connection(conn)
 
-    async def load_table_details(self, table_name: str) -> Optional[Dict[str, Any]]:
-        """Load detailed schema information for a specific table with optimized queries"""
+    async def get_table_ddl_times(self) -> Dict[str, float]:
+        """Get the last DDL time of every table as a Unix timestamp.
+
+        Used as a cheap signature of the schema: a cached table whose DDL time
+        changed needs its details reloaded, the rest stay valid indefinitely.
+        """
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = TABLE_NAME_FETCH_ARRAYSIZE
+            schema = await self._get_effective_schema(conn)
+            sql = """
+                SELECT object_name, last_ddl_time
+                FROM all_objects
+                WHERE owner = :owner
+                AND object_type = 'TABLE'
+                """
+
+            ddl_times: Dict[str, float] = {}
+            if self.thick_mode:
+
+                def collect() -> None:
+                    cursor.execute(sql, owner=schema)
+                    for name, ddl_time in cursor:
+                        ddl_times[name] = ddl_time.timestamp()
+
+                await asyncio.to_thread(collect)
+            else:
+                await cursor.execute(sql, owner=schema)
+                async for name, ddl_time in cursor:
+                    ddl_times[name] = ddl_time.timestamp()
+
+            return ddl_times
+        finally:
+            await self._close_connection(conn)
+
+    async def warm_schema(self) -> Tuple[Set[str], List[Dict[str, Any]]]:
+        """Fetch the table names and all PL/SQL objects of the schema at once.
+
+        Both dictionary queries run concurrently on separate pooled
+        connections, so a cold start pays for one round-trip instead of two.
+
+        Returns:
+            Tuple of (all table names, PL/SQL object descriptions)
+        """
+        table_names, plsql_objects = await asyncio.gather(
+            self.get_all_table_names(), self._get_all_pl_sql_objects()
+        )
+        return table_names, plsql_objects
+
+    async def _get_all_pl_sql_objects(self) -> List[Dict[str, Any]]:
+        """Get every PL/SQL object of the effective schema regardless of type"""
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
 
-            # Check if the table exists using result cache
-            table_exists = await self._execute_cursor_fetch(
+            cursor.rowfactory = _plsql_rowfactory(schema)
+
+            return await self._execute_cursor_fetch(
                 cursor,
                 """
-                SELECT /*+ RESULT_CACHE */ COUNT(*)
-                FROM all_tables
-                WHERE owner = :owner AND table_name = :table_name
+                SELECT object_name, object_type, status, created, last_ddl_time
+                FROM all_objects
+                WHERE owner = :owner
+                AND object_type IN (
+                    'PROCEDURE', 'FUNCTION', 'PACKAGE', 'PACKAGE BODY',
+                    'TRIGGER', 'TYPE', 'TYPE BODY'
+                )
+                ORDER BY object_name
                 """,
                 owner=schema,
-                table_name=table_name.upper(),
             )
+        finally:
+            await self._close_connection(conn)
 
-            if table_exists[0][0] == 0:
-                return None
+    async def load_table_details(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """Load detailed schema information for a specific table with optimized queries"""
+        # Existence is answered by the cached table index when available
+        table_name = canonical_name(table_name)
+        if not self._is_known_table(table_name):
+            return None
+
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            schema = await self._get_effective_schema(conn)
 
             # Get column information using result cache and index hints
             columns = await self._execute_cursor_fetch(
                 cursor,
-                """
+                f"""
                 SELECT /*+ RESULT_CACHE INDEX(atc) */
-                    column_name, data_type, nullable
+                    column_name, {COLUMN_TYPE_SQL} AS data_type, nullable
                 FROM all_tab_columns atc
                 WHERE owner = :owner AND table_name = :table_name
                 ORDER BY column_id
                 """,
                 owner=schema,
-                table_name=table_name.upper(),
+                table_name=table_name,
             )
 
-            column_info = []
-            for column, data_type, nullable in columns:
-                column_info.append(
-                    {"name": column, "type": data_type, "nullable": nullable == "Y"}
-                )
+            # Every table has at least one column, so no rows means no table
+            if not columns:
+                return None
+
+            column_info = [
+                {"name": column, "type": data_type, "nullable": nullable == "Y"}
+                for column, data_type, nullable in columns
+            ]
 
             # Get relationship information using optimized join order and result cache
             relationships = await self._execute_cursor_fetch(
@@ -437,14 +786,14 @@ class DatabaseConnector:
                 )
                 """,
                 owner=schema,
-                table_name=table_name.upper(),
+                table_name=table_name,
             )
 
-            relationship_info = {}
+            # A referenced table can appear in several rows (one per FK column),
+            # so entries are grouped rather than built with a dict comprehension
+            relationship_info: Dict[str, List[Dict[str, Any]]] = {}
             for direction, column, ref_table, ref_column in relationships:
-                if ref_table not in relationship_info:
-                    relationship_info[ref_table] = []
-                relationship_info[ref_table].append(
+                relationship_info.setdefault(ref_table, []).append(
                     {
                         "local_column": column,
                         "foreign_column": ref_column,
@@ -463,6 +812,187 @@ class DatabaseConnector:
         finally:
             await self._close_connection(conn)
 
+    async def load_many_table_details(
+        self, names: Iterable[str], concurrency: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load the details of several tables, choosing the query shape by count.
+
+        A few tables are loaded with concurrent load_table_details calls, each
+        on its own pooled connection, which keeps the indexed per-table
+        lookups. From BULK_DETAILS_MIN_TABLES on, load_tables_details fetches
+        them all with one column and one relationship query instead.
+
+        Args:
+            names: Table names to load
+            concurrency: Maximum number of per-table loads in flight at once
+
+        Returns:
+            Mapping of upper-cased table name to its details, like
+            load_tables_details; tables that don't exist are left out
+        """
+        unique_names = list(dict.fromkeys(map(canonical_name, names)))
+        if len(unique_names) >= BULK_DETAILS_MIN_TABLES:
+            return await self.load_tables_details(unique_names)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _load(name: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.load_table_details(name)
+
+        details = await asyncio.gather(*(_load(name) for name in unique_names))
+        return {
+            name: table_details
+            for name, table_details in zip(unique_names, details)
+            if table_details is not None
+        }
+
+    async def get_largest_table_names(self, limit: int) -> List[str]:
+        """Get the names of the largest tables by optimizer row count, largest first"""
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            schema = await self._get_effective_schema(conn)
+            # ROWNUM over an ordered subquery keeps this working on 11g
+            rows = await self._execute_cursor_fetch(
+                cursor,
+                """
+                SELECT table_name
+                FROM (
+                    SELECT table_name
+                    FROM all_tables
+                    WHERE owner = :owner
+                    ORDER BY num_rows DESC NULLS LAST, table_name
+                )
+                WHERE ROWNUM <= :limit
+                """,
+                owner=schema,
+                limit=limit,
+            )
+            return [sys.intern(name) for (name,) in rows]
+        finally:
+            await self._close_connection(conn)
+
+    async def load_tables_details(
+        self, names: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load the details of several tables with one column and one relationship query.
+
+        Both queries run concurrently on separate pooled connections, so the
+        whole batch costs about one round-trip.
+
+        Returns the same per-table structure as load_table_details, keyed by
+        upper-cased table name; tables that don't exist are left out.
+        """
+        unique_names = list(dict.fromkeys(map(canonical_name, names)))
+        if not unique_names:
+            return {}
+
+        try:
+            columns, relationships = await asyncio.gather(
+                self._load_tables_columns(unique_names),
+                self._load_tables_relationships(unique_names),
+            )
+        except oracledb.Error as e:
+            print(f"Error loading table details: {str(e)}", file=sys.stderr)
+            raise
+
+        details: Dict[str, Dict[str, Any]] = {}
+        for table_name, column, data_type, nullable in columns:
+            table = details.get(table_name)
+            if table is None:
+                table = details[table_name] = {"columns": [], "relationships": {}}
+            table["columns"].append(
+                {"name": column, "type": data_type, "nullable": nullable == "Y"}
+            )
+
+        for table_name, direction, column, ref_table, ref_column in relationships:
+            table = details.get(table_name)
+            if table is None:
+                continue
+            table["relationships"].setdefault(ref_table, []).append(
+                {
+                    "local_column": column,
+                    "foreign_column": ref_column,
+                    "direction": direction,
+                }
+            )
+
+        return details
+
+    async def _load_tables_columns(self, names: List[str]) -> List[Tuple]:
+        """Fetch (table, column, type, nullable) rows of the given tables"""
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            schema = await self._get_effective_schema(conn)
+            return await self._execute_cursor_fetch(
+                cursor,
+                f"""
+                SELECT /*+ RESULT_CACHE */
+                    table_name, column_name, {COLUMN_TYPE_SQL} AS data_type, nullable
+                FROM all_tab_columns
+                WHERE owner = :owner
+                AND table_name IN (SELECT column_value FROM TABLE(:table_names))
+                ORDER BY table_name, column_id
+                """,
+                owner=schema,
+                table_names=await self._string_collection(conn, names),
+            )
+        finally:
+            await self._close_connection(conn)
+
+    async def _load_tables_relationships(self, names: List[str]) -> List[Tuple]:
+        """Fetch the relationship rows of load_table_details for the given
+        tables, each tagged with the table it belongs to"""
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            schema = await self._get_effective_schema(conn)
+            return await self._execute_cursor_fetch(
+                cursor,
+                """
+                SELECT /*+ RESULT_CACHE */
+                    ac.table_name AS table_name,
+                    'OUTGOING' AS relationship_direction,
+                    acc.column_name AS source_column,
+                    rcc.table_name AS referenced_table,
+                    rcc.column_name AS referenced_column
+                FROM all_constraints ac
+                JOIN all_cons_columns acc ON acc.constraint_name = ac.constraint_name
+                                        AND acc.owner = ac.owner
+                JOIN all_cons_columns rcc ON rcc.constraint_name = ac.r_constraint_name
+                                        AND rcc.owner = ac.r_owner
+                WHERE ac.constraint_type = 'R'
+                AND ac.owner = :owner
+                AND ac.table_name IN (SELECT column_value FROM TABLE(:table_names))
+
+                UNION ALL
+
+                SELECT /*+ RESULT_CACHE */
+                    pk.table_name AS table_name,
+                    'INCOMING' AS relationship_direction,
+                    rcc.column_name AS source_column,
+                    ac.table_name AS referenced_table,
+                    acc.column_name AS referenced_column
+                FROM all_constraints ac
+                JOIN all_constraints pk ON pk.constraint_name = ac.r_constraint_name
+                                       AND pk.owner = ac.r_owner
+                JOIN all_cons_columns acc ON acc.constraint_name = ac.constraint_name
+                                        AND acc.owner = ac.owner
+                JOIN all_cons_columns rcc ON rcc.constraint_name = ac.r_constraint_name
+                                        AND rcc.owner = ac.r_owner
+                WHERE ac.constraint_type = 'R'
+                AND ac.r_owner = :owner
+                AND pk.constraint_type IN ('P', 'U')
+                AND pk.table_name IN (SELECT column_value FROM TABLE(:table_names))
+                """,
+                owner=schema,
+                table_names=await self._string_collection(conn, names),
+            )
+        finally:
+            await self._close_connection(conn)
+
     async def get_pl_sql_objects(
         self, object_type: str, name_pattern: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -472,44 +1002,25 @@ class DatabaseConnector:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
 
-            where_clause = "WHERE owner = :owner AND object_type = :object_type"
-            params = {"owner": schema, "object_type": object_type}
-
-            if name_pattern:
-                where_clause += " AND object_name LIKE :name_pattern"
-                params["name_pattern"] = name_pattern.upper()
+            # Let the driver build the result dictionaries while fetching
+            cursor.rowfactory = _plsql_rowfactory(schema)
 
-            objects = await self._execute_cursor_fetch(
+            # The statement text is constant so it hits the statement cache
+            # whether or not a pattern is given
+            return await self._execute_cursor_fetch(
                 cursor,
-                f"""
+                """
                 SELECT object_name, object_type, status, created, last_ddl_time
                 FROM all_objects
-                {where_clause}
+                WHERE owner = :owner
+                AND object_type = :object_type
+                AND (:name_pattern IS NULL OR object_name LIKE :name_pattern)
                 ORDER BY object_name
             """,
-                **params,
+                owner=schema,
+                object_type=object_type,
+                name_pattern=name_pattern.upper() if name_pattern else None,
             )
-
-            result = []
-
-            for name, obj_type, status, created, last_modified in objects:
-                obj_info = {
-                    "name": name,
-                    "type": obj_type,
-                    "status": status,
-                    "owner": schema,
-                }
-
-                if created:
-                    obj_info["created"] = created.strftime("%Y-%m-%d %H:%M:%S")
-                if last_modified:
-                    obj_info["last_modified"] = last_modified.strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-
-                result.append(obj_info)
-
-            return result
         finally:
             await self._close_connection(conn)
 
@@ -521,27 +1032,37 @@ class DatabaseConnector:
             schema = await self._get_effective_schema(conn)
 
             # Handle different object types accordingly
-            if object_type in ("PACKAGE", "PACKAGE BODY", "TYPE", "TYPE BODY"):
-                # For packages and types, we need to get the full source
-                source_lines = await self._execute_cursor_fetch(
-                    cursor,
-                    """
+            if object_type in SOURCE_TEXT_OBJECT_TYPES:
+                # For packages and types, we need to get the full source.
+                # Lines are streamed into one buffer instead of materializing
+                # a row list; each all_source line already ends with a newline.
+                cursor.arraysize = SOURCE_FETCH_ARRAYSIZE
+                sql = """
                     SELECT text
                     FROM all_source
                     WHERE owner = :owner
                     AND name = :name
                     AND type = :type
                     ORDER BY line
-                """,
-                    owner=schema,
-                    name=object_name,
-                    type=object_type,
-                )
+                """
+                params = {"owner": schema, "name": object_name, "type": object_type}
+                source = io.StringIO()
+                if self.thick_mode:
 
-                if not source_lines:
-                    return ""
+                    def collect() -> None:
+                        cursor.execute(sql, **params)
+                        for (line,) in cursor:
+                            if line:
+                                source.write(line)
 
-                return "\n".join(line[0] for line in source_lines)
+                    await asyncio.to_thread(collect)
+                else:
+                    await cursor.execute(sql, **params)
+                    async for (line,) in cursor:
+                        if line:
+                            source.write(line)
+
+                return source.getvalue()
             else:
                 # For procedures, functions, triggers, views, etc.
                 result = await self._execute_cursor_fetch(
@@ -561,8 +1082,11 @@ class DatabaseConnector:
                 if not result or not result[0]:
                     return ""
 
-                # Properly await the CLOB read operation
+                # Read the whole CLOB in one call; chunked reads would add a
+                # round-trip per chunk
                 clob = result[0][0]
+                if self.thick_mode:
+                    return await asyncio.to_thread(clob.read)
                 return await clob.read()
 
         except oracledb.Error as e:
@@ -571,91 +1095,133 @@ class DatabaseConnector:
         finally:
             await self._close_connection(conn)
 
-    async def get_table_constraints(self, table_name: str) -> List[Dict[str, Any]]:
-        """Get table constraints"""
+    async def get_objects_source(
+        self, object_type: str, object_names: Iterable[str]
+    ) -> Dict[str, str]:
+        """Get the source code for several PL/SQL objects of one type.
+
+        Packages and types are read from all_source with a single query that
+        binds the names as a collection; other object types get their DDL from
+        concurrent per-object get_object_source calls, as when fetched alone.
+
+        Returns:
+            Mapping of canonical object name to its source (empty string if
+            not found)
+        """
+        names = list(dict.fromkeys(map(canonical_name, object_names)))
+        if not names:
+            return {}
+
+        if object_type not in SOURCE_TEXT_OBJECT_TYPES:
+            sources = await asyncio.gather(
+                *(self.get_object_source(object_type, name) for name in names)
+            )
+            return dict(zip(names, sources))
+
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = SOURCE_FETCH_ARRAYSIZE
+            schema = await self._get_effective_schema(conn)
+            name_list = await self._string_collection(conn, names)
+
+            rows = await self._execute_cursor_fetch(
+                cursor,
+                """
+                SELECT name, text
+                FROM all_source
+                WHERE owner = :owner
+                AND type = :type
+                AND name IN (SELECT column_value FROM TABLE(:names))
+                ORDER BY name, line
+            """,
+                owner=schema,
+                type=object_type,
+                names=name_list,
+            )
+
+            sources: Dict[str, io.StringIO] = {name: io.StringIO() for name in names}
+            for name, line in rows:
+                if line:
+                    sources[name].write(line)
+
+            return {name: buf.getvalue() for name, buf in sources.items()}
+        except oracledb.Error as e:
+            print(f"Error getting object sources: {str(e)}", file=sys.stderr)
+            raise
+        finally:
+            await self._close_connection(conn)
+
+    async def _string_collection(self, conn, values: List[str]):
+        """Build a SYS.ODCIVARCHAR2LIST bind value holding the given strings"""
+        if self.thick_mode:
+            list_type = await asyncio.to_thread(conn.gettype, "SYS.ODCIVARCHAR2LIST")
+        else:
+            list_type = await conn.gettype("SYS.ODCIVARCHAR2LIST")
+        return list_type.newobject(values)
+
+    async def get_table_constraints(self, table_name: str) -> List[Constraint]:
+        """Get table constraints.
+
+        The constraints, their columns and the referenced columns of foreign
+        keys come back from a single query, one row per constraint column.
+        """
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
 
-            # Get all constraints for the table
-            constraints = await self._execute_cursor_fetch(
+            # A foreign key column is paired with the referenced key column at
+            # the same position
+            rows = await self._execute_cursor_fetch(
                 cursor,
                 """
                 SELECT ac.constraint_name,
                        ac.constraint_type,
-                       ac.search_condition
+                       ac.search_condition,
+                       acc.column_name,
+                       rc.table_name,
+                       rcc.column_name
                 FROM all_constraints ac
+                LEFT JOIN all_cons_columns acc
+                    ON acc.owner = ac.owner
+                    AND acc.constraint_name = ac.constraint_name
+                LEFT JOIN all_constraints rc
+                    ON rc.owner = ac.r_owner
+                    AND rc.constraint_name = ac.r_constraint_name
+                LEFT JOIN all_cons_columns rcc
+                    ON rcc.owner = rc.owner
+                    AND rcc.constraint_name = rc.constraint_name
+                    AND rcc.position = acc.position
                 WHERE ac.owner = :owner
                 AND ac.table_name = :table_name
+                ORDER BY ac.constraint_name, acc.position
             """,
                 owner=schema,
-                table_name=table_name.upper(),
+                table_name=canonical_name(table_name),
             )
 
             result = []
 
-            for constraint_name, constraint_type, condition in constraints:
-                # Map constraint type codes to descriptions
-                type_map = {
-                    "P": "PRIMARY KEY",
-                    "R": "FOREIGN KEY",
-                    "U": "UNIQUE",
-                    "C": "CHECK",
-                }
-
-                constraint_info = {
-                    "name": constraint_name,
-                    "type": type_map.get(constraint_type, constraint_type),
-                }
-
-                # Get columns involved in this constraint
-                columns = await self._execute_cursor_fetch(
-                    cursor,
-                    """
-                    SELECT column_name
-                    FROM all_cons_columns
-                    WHERE owner = :owner
-                    AND constraint_name = :constraint_name
-                    ORDER BY position
-                """,
-                    owner=schema,
-                    constraint_name=constraint_name,
+            for constraint_name, constraint_rows in groupby(rows, key=lambda row: row[0]):
+                constraint_rows = list(constraint_rows)
+                _, constraint_type, condition, _, ref_table, _ = constraint_rows[0]
+                constraint_info = Constraint(
+                    name=constraint_name,
+                    type=CONSTRAINT_TYPE_NAMES.get(constraint_type, constraint_type),
+                    columns=[row[3] for row in constraint_rows if row[3] is not None],
                 )
 
-                constraint_info["columns"] = [col[0] for col in columns]
-
-                # If it's a foreign key, get the referenced table/columns
-                if constraint_type == "R":
-                    ref_info = await self._execute_cursor_fetch(
-                        cursor,
-                        """
-                        SELECT ac.table_name,
-                               acc.column_name
-                        FROM all_constraints ac
-                        JOIN all_cons_columns acc ON ac.constraint_name = acc.constraint_name
-                        WHERE ac.constraint_name = (
-                            SELECT r_constraint_name
-                            FROM all_constraints
-                            WHERE owner = :owner
-                            AND constraint_name = :constraint_name
-                        )
-                        AND acc.owner = ac.owner
-                        ORDER BY acc.position
-                    """,
-                        owner=schema,
-                        constraint_name=constraint_name,
+                # If it's a foreign key, include the referenced table/columns
+                if constraint_type == "R" and ref_table:
+                    constraint_info.references = ConstraintReference(
+                        table=ref_table,
+                        columns=[row[5] for row in constraint_rows if row[5] is not None],
                     )
 
-                    if ref_info:
-                        constraint_info["references"] = {
-                            "table": ref_info[0][0],
-                            "columns": [col[1] for col in ref_info],
-                        }
-
                 # For check constraints, include the condition
                 if constraint_type == "C" and condition:
-                    constraint_info["condition"] = condition
+                    constraint_info.condition = condition
 
                 result.append(constraint_info)
 
@@ -663,58 +1229,48 @@ class DatabaseConnector:
         finally:
             await self._close_connection(conn)
 
-    async def get_table_indexes(self, table_name: str) -> List[Dict[str, Any]]:
-        """Get table indexes"""
+    async def get_table_indexes(self, table_name: str) -> List[Index]:
+        """Get table indexes, with their columns, from a single query"""
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
 
-            # Get all indexes for the table
-            indexes = await self._execute_cursor_fetch(
+            rows = await self._execute_cursor_fetch(
                 cursor,
                 """
                 SELECT ai.index_name,
                        ai.uniqueness,
                        ai.tablespace_name,
-                       ai.status
+                       ai.status,
+                       aic.column_name
                 FROM all_indexes ai
+                LEFT JOIN all_ind_columns aic
+                    ON aic.index_owner = ai.owner
+                    AND aic.index_name = ai.index_name
                 WHERE ai.owner = :owner
                 AND ai.table_name = :table_name
+                ORDER BY ai.index_name, aic.column_position
             """,
                 owner=schema,
-                table_name=table_name.upper(),
+                table_name=canonical_name(table_name),
             )
 
             result = []
 
-            for index_name, uniqueness, tablespace, status in indexes:
-                index_info = {"name": index_name, "unique": uniqueness == "UNIQUE"}
-
-                if tablespace:
-                    index_info["tablespace"] = tablespace
-
-                if status:
-                    index_info["status"] = status
-
-                # Get columns in this index
-                columns = await self._execute_cursor_fetch(
-                    cursor,
-                    """
-                    SELECT column_name
-                    FROM all_ind_columns
-                    WHERE index_owner = :owner
-                    AND index_name = :index_name
-                    ORDER BY column_position
-                """,
-                    owner=schema,
-                    index_name=index_name,
+            for index_name, index_rows in groupby(rows, key=lambda row: row[0]):
+                index_rows = list(index_rows)
+                _, uniqueness, tablespace, status, _ = index_rows[0]
+                result.append(
+                    Index(
+                        name=index_name,
+                        unique=uniqueness == "UNIQUE",
+                        columns=[row[4] for row in index_rows if row[4] is not None],
+                        tablespace=tablespace or None,
+                        status=status or None,
+                    )
                 )
 
-                index_info["columns"] = [col[0] for col in columns]
-
-                result.append(index_info)
-
             return result
         finally:
             await self._close_connection(conn)
@@ -747,14 +1303,72 @@ class DatabaseConnector:
                 owner=schema,
             )
 
-            result = []
+            return [
+                {"name": name, "type": obj_type, "owner": owner}
+                for name, obj_type, owner in dependencies
+            ]
+        except oracledb.Error as e:
+            print(f"Error getting dependent objects: {str(e)}", file=sys.stderr)
+            raise
+        finally:
+            await self._close_connection(conn)
+
+    async def get_dependents_with_details(
+        self, object_name: str
+    ) -> List[Dict[str, Any]]:
+        """Get dependent objects together with their columns in one query.
 
-            for name, obj_type, owner in dependencies:
-                result.append({"name": name, "type": obj_type, "owner": owner})
+        Views and other column-bearing dependents get their column list from
+        all_tab_columns in the same round-trip, avoiding a follow-up lookup per
+        dependent. Dependents without columns get an empty list.
+        """
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            schema = await self._get_effective_schema(conn)
 
-            return result
+            rows = await self._execute_cursor_fetch(
+                cursor,
+                f"""
+                WITH deps AS (
+                    SELECT /*+ MATERIALIZE */
+                           name, type, owner
+                    FROM all_dependencies
+                    WHERE referenced_name = :object_name
+                    AND referenced_owner = :owner
+                )
+                SELECT /*+ LEADING(deps) USE_NL(ao) INDEX(ao) */
+                    ao.object_name, ao.object_type, ao.owner,
+                    atc.column_name, {COLUMN_TYPE_SQL} AS data_type, atc.nullable
+                FROM deps
+                JOIN all_objects ao ON deps.name = ao.object_name
+                                   AND deps.type = ao.object_type
+                                   AND deps.owner = ao.owner
+                LEFT JOIN all_tab_columns atc ON atc.owner = ao.owner
+                                             AND atc.table_name = ao.object_name
+                ORDER BY ao.owner, ao.object_type, ao.object_name, atc.column_id
+            """,
+                object_name=object_name,
+                owner=schema,
+            )
+
+            return [
+                {
+                    "name": name,
+                    "type": obj_type,
+                    "owner": owner,
+                    "columns": [
+                        {"name": column, "type": data_type, "nullable": nullable == "Y"}
+                        for *_, column, data_type, nullable in group
+                        if column is not None
+                    ],
+                }
+                for (owner, obj_type, name), group in groupby(
+                    rows, key=lambda row: (row[2], row[1], row[0])
+                )
+            ]
         except oracledb.Error as e:
-            print(f"Error getting dependent objects: {str(e)}", file=sys.stderr)
+            print(f"Error getting dependent object details: {str(e)}", file=sys.stderr)
             raise
         finally:
             await self._close_connection(conn)
@@ -768,22 +1382,17 @@ class DatabaseConnector:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
 
-            where_clause = "WHERE owner = :owner"
-            params = {"owner": schema}
-
-            if type_pattern:
-                where_clause += " AND type_name LIKE :type_pattern"
-                params["type_pattern"] = type_pattern.upper()
-
             types = await self._execute_cursor_fetch(
                 cursor,
-                f"""
+                """
                 SELECT type_name, typecode
                 FROM all_types
-                {where_clause}
+                WHERE owner = :owner
+                AND (:type_pattern IS NULL OR type_name LIKE :type_pattern)
                 ORDER BY type_name
             """,
-                **params,
+                owner=schema,
+                type_pattern=type_pattern.upper() if type_pattern else None,
             )
 
             result = []
@@ -826,7 +1435,7 @@ class DatabaseConnector:
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
-            requested_table = table_name.upper()
+            requested_table = canonical_name(table_name)
             schema = await self._get_effective_schema(conn)
 
             # Helper to run the two directional queries for a given owner
@@ -904,93 +1513,165 @@ class DatabaseConnector:
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
-            # Use Oracle's built-in similarity features
+            # Use Oracle's built-in similarity features. The limit is applied
+            # in the query (ROWNUM over an ordered subquery keeps this working
+            # on 11g) so only the returned names are sorted out and shipped.
             results = await self._execute_cursor_fetch(
                 cursor,
                 """
-                SELECT /*+ RESULT_CACHE */ DISTINCT table_name
-                FROM all_tables
-                WHERE owner = :owner
-                AND (
-                    -- Direct matches first
-                    UPPER(table_name) LIKE '%' || :search_term || '%'
-                    -- Then similar names using built-in similarity calculation
-                    OR UTL_MATCH.EDIT_DISTANCE_SIMILARITY(
-                        UPPER(table_name),
-                        :search_term
-                    ) > 65  -- Minimum similarity threshold (65%)
+                SELECT table_name
+                FROM (
+                    SELECT /*+ RESULT_CACHE */ DISTINCT table_name
+                    FROM all_tables
+                    WHERE owner = :owner
+                    AND (
+                        -- Direct matches first
+                        UPPER(table_name) LIKE '%' || :search_term || '%'
+                        -- Then similar names using built-in similarity calculation
+                        OR UTL_MATCH.EDIT_DISTANCE_SIMILARITY(
+                            UPPER(table_name),
+                            :search_term
+                        ) > 65  -- Minimum similarity threshold (65%)
+                    )
+                    ORDER BY
+                        CASE
+                            WHEN UPPER(table_name) LIKE '%' || :search_term || '%' THEN 0
+                            ELSE 1
+                        END,
+                        UTL_MATCH.EDIT_DISTANCE_SIMILARITY(
+                            UPPER(table_name),
+                            :search_term
+                        ) DESC
                 )
-                ORDER BY
-                    CASE
-                        WHEN UPPER(table_name) LIKE '%' || :search_term || '%' THEN 0
-                        ELSE 1
-                    END,
-                    UTL_MATCH.EDIT_DISTANCE_SIMILARITY(
-                        UPPER(table_name),
-                        :search_term
-                    ) DESC
+                WHERE ROWNUM <= :limit
             """,
                 owner=schema,
                 search_term=search_term.upper(),
+                limit=limit,
             )
 
-            return [row[0] for row in results][:limit]
+            return [row[0] for row in results]
 
         finally:
             await self._close_connection(conn)
 
-    async def search_columns_in_database(
-        self, search_term: str
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """Search for columns with a given pattern within a list of tables"""
+    async def search_in_database_multi(
+        self, search_terms: List[str], limit: int = 20
+    ) -> Dict[str, List[str]]:
+        """Search table names for several terms in a single query.
+
+        Uses the same substring and similarity matching as search_in_database,
+        with the terms bound as one collection and the limit applied per term.
+
+        Returns:
+            Matching table names per (upper-cased) term, best matches first
+        """
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
-            result = {}
-
-            # Get columns for the specified tables that match the search term
+            terms = list(dict.fromkeys(term.upper() for term in search_terms))
             rows = await self._execute_cursor_fetch(
                 cursor,
                 """
-                SELECT /*+ RESULT_CACHE */
-                    table_name,
-                    column_name,
-                    CASE
-                        WHEN data_type = 'NUMBER' AND data_precision IS NULL THEN 'NUMBER'
-                        WHEN data_type = 'NUMBER' AND data_precision IS NOT NULL THEN
-                            'NUMBER(' || data_precision ||
-                            CASE
-                                WHEN data_scale IS NOT NULL AND data_scale != 0
-                                    THEN ',' || data_scale
-                                ELSE ''
-                                END || ')'
-                        WHEN data_type = 'VARCHAR2' THEN data_type || '(' || data_length || ')'
-                        WHEN data_type = 'CHAR' THEN data_type || '(' || data_length || ')'
-                        ELSE data_type
-                        END as data_type,
-                    nullable
-                FROM all_tab_columns
-                WHERE owner = :owner
-                  AND UPPER(column_name) LIKE '%' || :search_term || '%'
-                ORDER BY table_name, column_id
+                SELECT term, table_name
+                FROM (
+                    SELECT /*+ RESULT_CACHE */
+                        s.column_value AS term,
+                        t.table_name,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY s.column_value
+                            ORDER BY
+                                CASE
+                                    WHEN UPPER(t.table_name) LIKE '%' || s.column_value || '%' THEN 0
+                                    ELSE 1
+                                END,
+                                UTL_MATCH.EDIT_DISTANCE_SIMILARITY(
+                                    UPPER(t.table_name),
+                                    s.column_value
+                                ) DESC
+                        ) AS match_rank
+                    FROM all_tables t
+                    CROSS JOIN TABLE(:terms) s
+                    WHERE t.owner = :owner
+                    AND (
+                        UPPER(t.table_name) LIKE '%' || s.column_value || '%'
+                        OR UTL_MATCH.EDIT_DISTANCE_SIMILARITY(
+                            UPPER(t.table_name),
+                            s.column_value
+                        ) > 65
+                    )
+                )
+                WHERE match_rank <= :limit
+                ORDER BY term, match_rank
             """,
                 owner=schema,
-                search_term=search_term.upper(),
+                terms=await self._string_collection(conn, terms),
+                limit=limit,
             )
 
-            for table_name, column_name, data_type, nullable in rows:
-                if table_name not in result:
-                    result[table_name] = []
-                result[table_name].append(
-                    {
-                        "name": column_name,
-                        "type": data_type,
-                        "nullable": nullable == "Y",
-                    }
+            results: Dict[str, List[str]] = {term: [] for term in terms}
+            for term, table_name in rows:
+                results[term].append(table_name)
+            return results
+
+        finally:
+            await self._close_connection(conn)
+
+    async def search_columns_in_database(
+        self, search_term: str, limit: Optional[int] = None
+    ) -> Dict[str, List[Column]]:
+        """Search all tables of the schema for columns matching a pattern.
+
+        Args:
+            search_term: Substring to look for in column names; "_" and "%"
+                match only themselves
+            limit: Maximum number of tables to return matches for. The limit is
+                applied in the query, so only those tables' rows are fetched.
+
+        Returns:
+            Matching columns grouped by table name, in table name order
+        """
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            schema = await self._get_effective_schema(conn)
+
+            # Get the matching columns of the first :table_limit matching tables
+            rows = await self._execute_cursor_fetch(
+                cursor,
+                f"""
+                SELECT table_name, column_name, data_type, nullable
+                FROM (
+                    SELECT /*+ RESULT_CACHE */
+                        table_name,
+                        column_name,
+                        column_id,
+                        {COLUMN_TYPE_SQL} AS data_type,
+                        nullable,
+                        DENSE_RANK() OVER (ORDER BY table_name) AS table_rank
+                    FROM all_tab_columns
+                    WHERE owner = :owner
+                      AND UPPER(column_name) LIKE '%' || :search_term || '%' ESCAPE '\\'
                 )
+                WHERE table_rank <= :table_limit
+                ORDER BY table_name, column_id
+            """,
+                owner=schema,
+                # Matched as a literal substring, like the cached column index
+                search_term=_like_literal(search_term.upper()),
+                # A plain rank predicate (no "IS NULL OR") lets Oracle push the
+                # limit into the window sort and stop once it is reached
+                table_limit=sys.maxsize if limit is None else limit,
+            )
 
-            return result
+            return {
+                table_name: [
+                    Column(column_name, data_type, nullable == "Y")
+                    for _, column_name, data_type, nullable in table_rows
+                ]
+                for table_name, table_rows in groupby(rows, key=lambda row: row[0])
+            }
         finally:
             await self._close_connection(conn)
 
@@ -1017,7 +1698,7 @@ class DatabaseConnector:
             # Check if this is a SELECT query (has description)
             if self._is_select_query(sql):
                 rows = await self._execute_cursor_fetch(
-                    cursor, sql, max_rows, **(params or {})
+                    cursor, sql, max_rows, cache_statement=False, **(params or {})
                 )
                 columns = (
                     [desc[0] for desc in cursor.description]
@@ -1038,7 +1719,9 @@ class DatabaseConnector:
                         "Read-only mode: only SELECT and analysis statements are permitted."
                     )
 
-                await self._execute_cursor_no_fetch(cursor, sql, **(params or {}))
+                await self._execute_cursor_no_fetch(
+                    cursor, sql, cache_statement=False, **(params or {})
+                )
                 row_count = cursor.rowcount
 
                 # Only commit when the statement is an explicit DML or DDL operation
@@ -1072,7 +1755,9 @@ class DatabaseConnector:
 
             # First create an explain plan
             plan_statement = f"EXPLAIN PLAN FOR {query}"
-            await cursor.execute(plan_statement)
+            await self._execute_cursor_no_fetch(
+                cursor, plan_statement, cache_statement=False
+            )
 
             # Then retrieve the execution plan with cost and cardinality information
             plan_rows = await self._execute_cursor_fetch(
@@ -1186,77 +1871,14 @@ class DatabaseConnector:
         """Return True if the statement is a single, pure SELECT or WITH (CTE) statement.
 
         Uses sqlparse to robustly parse SQL, preventing stacked statements and bypasses via string literals.
+        Plain single statements starting with a known keyword skip the parse.
         """
-        sql_stripped = sql.strip()
-        if not sql_stripped:
-            return False
-
-        statements = sqlparse.parse(sql)
-        if len(statements) != 1:
-            return False  # stacked / multiple statements
-
-        stmt = statements[0]
-        first_token = stmt.token_first(skip_cm=True)
-        if first_token is None:
-            return False
-
-        first_val = first_token.value.upper()
-
-        # Use sqlparse's statement type when available for robustness (handles CTEs)
-        stmt_type = None
-        try:
-            stmt_type = stmt.get_type()  # Often returns 'SELECT' for WITH/SELECT
-        except Exception:  # pragma: no cover - defensive
-            stmt_type = None
-
-        if stmt_type == "SELECT":
-            return True
-
-        # Fallback explicit checks
-        if first_val in {"SELECT", "WITH"}:
-            return True
-
-        # Read-only analysis style commands still treated as safe
-        if first_val in {"EXPLAIN", "DESCRIBE", "SHOW"}:
-            return True
-
-        return False
+        return _classify_statement(sql)[0]
 
     @staticmethod
     def _is_write_operation(sql: str) -> bool:
-        """Return True if the SQL statement modifies data or structure, using sqlparse for accuracy."""
-        write_ops = {
-            "INSERT",
-            "UPDATE",
-            "DELETE",
-            "MERGE",
-            "CREATE",
-            "ALTER",
-            "DROP",
-            "TRUNCATE",
-            "GRANT",
-            "REVOKE",
-            "REPLACE",
-        }
-
-        statements = sqlparse.parse(sql)
-        if not statements or len(statements) != 1:
-            return False
+        """Return True if the SQL statement modifies data or structure, using sqlparse for accuracy.
 
-        stmt = statements[0]
-        first_token = stmt.token_first(skip_cm=True)
-        if first_token is None:
-            return False
-
-        first_val = first_token.value.upper()
-
-        # Explicitly exclude read-only leading tokens before generic DML/DDL classification
-        if first_val in {"SELECT", "WITH", "EXPLAIN", "DESCRIBE", "SHOW"}:
-            return False
-
-        if first_token.ttype in (
-            sqlparse.tokens.Keyword.DML,
-            sqlparse.tokens.Keyword.DDL,
-        ) or (first_token.ttype in sqlparse.tokens.Keyword and first_val in write_ops):
-            return True
-        return False
+        Plain single statements starting with a known keyword skip the parse.
+        """
+        return _classify_statement(sql)[1]
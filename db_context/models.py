@@ -1,35 +1,198 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Protocol, Optional, Any
+from typing import Dict, FrozenSet, Iterable, List, Protocol, Optional, Any, Tuple
 from pathlib import Path
 from .schema.formatter import format_schema
 
-@dataclass
+@dataclass(slots=True)
+class Column:
+    name: str
+    type: str
+    nullable: bool
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Column":
+        """Build a Column from a persisted or connector-provided dictionary."""
+        return cls(data["name"], data["type"], data["nullable"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the column as a dictionary for persisting the cache."""
+        return {"name": self.name, "type": self.type, "nullable": self.nullable}
+
+# Compared and hashed by identity: a reloaded table is always a new object, so
+# the instance itself can key caches of derived data such as formatted schemas.
+@dataclass(slots=True, eq=False)
 class TableInfo:
     table_name: str
-    columns: List[Dict[str, Any]]
+    columns: List[Column]
     relationships: Dict[str, Dict[str, Any]]
     fully_loaded: bool = False
+    ddl_time: Optional[float] = None  # all_objects.last_ddl_time when loaded
+    # format_schema() output, computed on first use. Not persisted (orjson
+    # skips underscore fields and to_dict lists the fields explicitly).
+    _formatted: Optional[str] = field(default=None, repr=False)
+
+    @classmethod
+    def from_dict(cls, table_name: str, data: Dict[str, Any]) -> "TableInfo":
+        """Build a TableInfo from its persisted or connector-provided dictionary.
+
+        Columns may be dictionaries or the positional [name, type, nullable]
+        rows that to_dict persists.
+        """
+        return cls(
+            table_name=table_name,
+            columns=[
+                Column(*column) if isinstance(column, list) else Column.from_dict(column)
+                for column in data["columns"]
+            ],
+            relationships=data["relationships"],
+            fully_loaded=data.get("fully_loaded", False),
+            ddl_time=data.get("ddl_time"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a shallow dictionary of the fields for persisting the cache.
+
+        Columns are written as positional [name, type, nullable] rows rather
+        than dictionaries, so the field names aren't repeated for every column.
+        """
+        return {
+            "table_name": self.table_name,
+            "columns": [
+                [column.name, column.type, column.nullable] for column in self.columns
+            ],
+            "relationships": self.relationships,
+            "fully_loaded": self.fully_loaded,
+            "ddl_time": self.ddl_time,
+        }
 
     def format_schema(self) -> str:
         """Format the schema information for the table, with smart relationship grouping.
         
+        The text is computed once per instance; a table whose definition
+        changes is reloaded as a new TableInfo.
+
         Returns:
             A formatted string containing the table's complete schema information.
         """
-        return format_schema(
-            self.table_name,
-            self.columns,
-            self.relationships
-        )
+        if self._formatted is None:
+            self._formatted = format_schema(
+                self.table_name,
+                self.columns,
+                self.relationships
+            )
+        return self._formatted
 
-@dataclass
+@dataclass(slots=True)
 class SchemaCache:
     tables: Dict[str, TableInfo]
     last_updated: float
-    all_table_names: Set[str]  # Set of all table names in the database
+    all_table_names: FrozenSet[str]  # Set of all table names in the database
+    _sorted_names: Optional[Tuple[str, ...]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def sorted_table_names(self) -> Tuple[str, ...]:
+        """Return the table names in sorted order, computed once per name set."""
+        if self._sorted_names is None:
+            self._sorted_names = tuple(sorted(self.all_table_names))
+        return self._sorted_names
+
+    def update_table_names(
+        self, added: Iterable[str] = (), removed: Iterable[str] = ()
+    ) -> bool:
+        """Add and remove table names, returning whether the name set changed.
+
+        The frozenset (and the sorted names derived from it) is only rebuilt
+        when a name is actually new or actually gone.
+        """
+        names = self.all_table_names
+        added = [name for name in added if name not in names]
+        removed = [name for name in removed if name in names]
+        if not added and not removed:
+            return False
+        self.all_table_names = names.union(added).difference(removed)
+        self._sorted_names = None
+        return True
+
+@dataclass(slots=True)
+class ConstraintReference:
+    table: str
+    columns: List[str]
+
+@dataclass(slots=True)
+class Constraint:
+    name: str
+    type: str  # Readable constraint type, e.g. "PRIMARY KEY"
+    columns: List[str]
+    references: Optional[ConstraintReference] = None  # Foreign keys only
+    condition: Optional[str] = None  # Check constraints only
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Constraint":
+        """Build a Constraint from its persisted dictionary."""
+        references = data.get("references")
+        return cls(
+            name=data["name"],
+            type=data["type"],
+            columns=data["columns"],
+            references=ConstraintReference(references["table"], references["columns"])
+            if references
+            else None,
+            condition=data.get("condition"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the constraint as a dictionary for persisting the cache."""
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "type": self.type,
+            "columns": self.columns,
+        }
+        if self.references is not None:
+            data["references"] = {
+                "table": self.references.table,
+                "columns": self.references.columns,
+            }
+        if self.condition is not None:
+            data["condition"] = self.condition
+        return data
+
+@dataclass(slots=True)
+class Index:
+    name: str
+    unique: bool
+    columns: List[str]
+    tablespace: Optional[str] = None
+    status: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Index":
+        """Build an Index from its persisted dictionary."""
+        return cls(
+            name=data["name"],
+            unique=data["unique"],
+            columns=data["columns"],
+            tablespace=data.get("tablespace"),
+            status=data.get("status"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the index as a dictionary for persisting the cache."""
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "unique": self.unique,
+            "columns": self.columns,
+        }
+        if self.tablespace is not None:
+            data["tablespace"] = self.tablespace
+        if self.status is not None:
+            data["status"] = self.status
+        return data
 
 class SchemaManager(Protocol):
     """Protocol defining the interface for schema management"""
-    def is_cache_valid(self, cache_type: str, key: str) -> bool: ...
+    cache: Optional[SchemaCache]
+
+    def get_cached(self, cache_type: str, key: str) -> Optional[Any]: ...
     def update_cache(self, cache_type: str, key: str, data: Any) -> None: ...
     async def save_cache(self, cache: Optional[SchemaCache] = None) -> None: ...
\ No newline at end of file
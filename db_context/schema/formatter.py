@@ -84,9 +84,16 @@ Relationships:
 
 For less than RELATIONSHIP_GROUPING_THRESHOLD relationships, each relationship is listed individually without grouping.
 """
-from typing import List, Dict, Any, Set, Tuple
+from typing import TYPE_CHECKING, List, Dict, Any, Tuple
+import io
 import re
 from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    from ..models import Column
 
 # Configuration constants
 RELATIONSHIP_GROUPING_THRESHOLD = 10  # Number of relationships before grouping is applied
@@ -94,8 +101,25 @@ COLUMN_GROUPING_THRESHOLD = 20        # Number of columns before compact format
 MIN_PREFIX_LENGTH = 3                 # Minimum length for meaningful prefix grouping
 # Output safety/UX limits
 MAX_CELL_WIDTH = 120                  # Truncate very wide cell values to prevent token bloat / prompt abuse
+# Cell value types whose text never contains line breaks, pipes or backticks
+PLAIN_CELL_TYPES = frozenset({int, float, Decimal, datetime, date})
+# Table naming patterns like HIST_, TMP_, etc. and their display names, compiled once
+COMMON_TABLE_PATTERNS = tuple(
+    (re.compile(pattern), display)
+    for pattern, display in (
+        (r'^HIST_', 'HIST_*'),
+        (r'^TMP_', 'TMP_*'),
+        (r'^BAK_', 'BAK_*'),
+        (r'^ARCH_', 'ARCH_*'),
+        (r'_HISTORY$', '*_HISTORY'),
+        (r'_ARCHIVE$', '*_ARCHIVE'),
+        (r'_BACKUP$', '*_BACKUP'),
+        (r'_\d{4,}$', '*_YYYY'),  # Tables with year suffixes
+        (r'_[A-Z]{2,3}$', '*_XX'),  # Tables with 2-3 letter suffixes
+    )
+)
 
-def format_schema(table_name: str, columns: List[Dict[str, Any]], 
+def format_schema(table_name: str, columns: List["Column"], 
                 relationships: Dict[str, Dict[str, Any]]) -> str:
     """Format complete schema information for a table."""
     result = [f"\nTable: {table_name}"]
@@ -113,30 +137,25 @@ def format_schema(table_name: str, columns: List[Dict[str, Any]],
     
     return "\n".join(result)
 
-def format_columns(columns: List[Dict[str, Any]], compact: bool = False) -> List[str]:
+def format_columns(columns: List["Column"], compact: bool = False) -> List[str]:
     """Format column information, with option for compact representation for many columns."""
     result = []
     
     if compact:
         # Group columns by nullability for compact view
-        null_cols = []
-        not_null_cols = []
-        for column in columns:
-            col_str = f"{column['name']}({column['type']})"
-            if column["nullable"]:
-                null_cols.append(col_str)
-            else:
-                not_null_cols.append(col_str)
+        not_null_cols = ", ".join(f"{c.name}({c.type})" for c in columns if not c.nullable)
+        null_cols = ", ".join(f"{c.name}({c.type})" for c in columns if c.nullable)
         
         if not_null_cols:
-            result.append("  NOT NULL: " + ", ".join(not_null_cols))
+            result.append("  NOT NULL: " + not_null_cols)
         if null_cols:
-            result.append("  NULL: " + ", ".join(null_cols))
+            result.append("  NULL: " + null_cols)
     else:
         # Detailed view for fewer columns
-        for column in columns:
-            nullable = "NULL" if column["nullable"] else "NOT NULL"
-            result.append(f"  - {column['name']}: {column['type']} {nullable}")
+        result = [
+            f"  - {c.name}: {c.type} {'NULL' if c.nullable else 'NOT NULL'}"
+            for c in columns
+        ]
     
     return result
 
@@ -232,25 +251,13 @@ def _group_relationships(relationships: List[tuple]) -> List[Dict[str, Any]]:
 
 def _group_by_patterns(relationships: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
     """Group tables by common naming patterns like HIST_, TMP_, etc."""
-    common_patterns = {
-        r'^HIST_': 'HIST_*',
-        r'^TMP_': 'TMP_*',
-        r'^BAK_': 'BAK_*',
-        r'^ARCH_': 'ARCH_*',
-        r'_HISTORY$': '*_HISTORY',
-        r'_ARCHIVE$': '*_ARCHIVE',
-        r'_BACKUP$': '*_BACKUP',
-        r'_\d{4,}$': '*_YYYY',  # Tables with year suffixes
-        r'_[A-Z]{2,3}$': '*_XX',  # Tables with 2-3 letter suffixes
-    }
-    
     groups = defaultdict(lambda: {'pattern': '', 'tables': [], 'column_patterns': set()})
     unmatched = []
     
     for table, rel in relationships:
         matched = False
-        for pattern, display in common_patterns.items():
-            if re.search(pattern, table):
+        for pattern, display in COMMON_TABLE_PATTERNS:
+            if pattern.search(table):
                 col_pattern = f"{rel['local_column']}->{rel['foreign_column']}"
                 groups[display]['pattern'] = display
                 groups[display]['tables'].append((table, rel))
@@ -363,6 +370,19 @@ def _format_relationship_groups(groups: List[Dict[str, Any]], result: List[str])
             for pattern in sorted(group['column_patterns']):
                 result.append(f"      {pattern}")
 
+@lru_cache(maxsize=256)
+def _line_templates(col_widths: Tuple[int, ...]) -> Tuple[str, str]:
+    """Return the row format string and the separator line for column widths.
+
+    One format string pads a whole line in a single call, instead of a ljust
+    per cell. Both depend only on the widths, which repeat across queries
+    returning the same columns, so they are built once per width tuple.
+    """
+    line_format = "| " + " | ".join(f"{{:<{width}}}" for width in col_widths) + " |"
+    separator = "\n| " + " | ".join("-" * max(3, width) for width in col_widths) + " |"
+    return line_format, separator
+
+
 def format_sql_query_result(result: Dict[str, Any]) -> str:
     """
     Format SQL query results as a markdown table.
@@ -379,52 +399,55 @@ def format_sql_query_result(result: Dict[str, Any]) -> str:
     headers = [str(h) for h in result["columns"]]
     rows = result["rows"]
 
-    def _escape(val: Any) -> str:
-        if val is None:
-            return ""
-        s = str(val)
-        # Normalize whitespace to single spaces to avoid multi-line table injection
-        s = s.replace("\r", " ").replace("\n", " ")
-        # Truncate overly long values
-        truncated = False
-        if len(s) > MAX_CELL_WIDTH:
-            s = s[: MAX_CELL_WIDTH - 1] + "…"
-            truncated = True
-        # Escape pipe which breaks markdown tables
-        s = s.replace("|", "\\|")
-        # Backticks sometimes cause rendering issues inside larger markdown contexts
-        s = s.replace("`", "'")
-        return s, truncated
-
-    # Preprocess cells to apply escaping + truncation and compute widths
+    # Preprocess cells to apply escaping + truncation and compute widths.
+    # The escaping is inlined and the widths are tracked in this same loop:
+    # a helper call per cell cost more than the escaping itself, and on
+    # CPython this beats transposing the rows and taking max(map(len, column))
+    # per column.
     processed_rows: List[List[str]] = []
     truncated_any = False
     col_widths = [len(h) for h in headers]
     for row in rows:
         processed_row: List[str] = []
+        append = processed_row.append
         for idx, header in enumerate(headers):
-            cell_raw = row.get(header, "")
-            cell, was_trunc = _escape(cell_raw)
-            if was_trunc:
-                truncated_any = True
-            processed_row.append(cell)
-            if len(cell) > col_widths[idx]:
-                col_widths[idx] = len(cell)
+            val = row.get(header)
+            if val is None:
+                cell = ""
+            else:
+                cell = str(val)
+                # Truncate overly long values first, so the replacements below
+                # only scan what is kept (they don't change the length)
+                if len(cell) > MAX_CELL_WIDTH:
+                    cell = cell[: MAX_CELL_WIDTH - 1] + "…"
+                    truncated_any = True
+                if type(val) not in PLAIN_CELL_TYPES:
+                    # Normalize whitespace to single spaces to avoid multi-line table injection
+                    cell = cell.replace("\r", " ").replace("\n", " ")
+                    # Escape pipe which breaks markdown tables; backticks sometimes
+                    # cause rendering issues inside larger markdown contexts
+                    cell = cell.replace("|", "\\|").replace("`", "'")
+            append(cell)
+            width = len(cell)
+            if width > col_widths[idx]:
+                col_widths[idx] = width
         processed_rows.append(processed_row)
 
-    def _pad(cell: str, width: int) -> str:
-        return cell.ljust(width)
+    line_format, separator = _line_templates(tuple(col_widths))
 
-    lines: List[str] = []
+    # Write each line straight into one buffer instead of collecting them
+    buf = io.StringIO()
+    write = buf.write
     # Header
-    lines.append("| " + " | ".join(_pad(h, col_widths[i]) for i, h in enumerate(headers)) + " |")
+    write(line_format.format(*headers))
     # Separator
-    lines.append("| " + " | ".join("-" * max(3, col_widths[i]) for i in range(len(headers))) + " |")
+    write(separator)
     # Data
     for prow in processed_rows:
-        lines.append("| " + " | ".join(_pad(prow[i], col_widths[i]) for i in range(len(headers))) + " |")
+        write("\n")
+        write(line_format.format(*prow))
 
     if truncated_any:
-        lines.append("\nNote: Some values truncated to " + str(MAX_CELL_WIDTH) + " chars (…)")
+        write("\n\nNote: Some values truncated to " + str(MAX_CELL_WIDTH) + " chars (…)")
 
-    return "\n".join(lines)
\ No newline at end of file
+    return buf.getvalue()
\ No newline at end of file
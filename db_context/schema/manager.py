@@ -1,10 +1,85 @@
+import asyncio
 import json
+import sqlite3
 import time
+from itertools import islice
 from pathlib import Path
 import sys
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any, Set, Tuple, Union
 
-from ..models import TableInfo, SchemaCache, SchemaManager as SchemaManagerProtocol
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+from ..models import Column, Constraint, Index, TableInfo, SchemaCache, SchemaManager as SchemaManagerProtocol
+from ..utils import canonical_name
+from .name_index import ColumnNameIndex, TableNameIndex
+
+# The cache is a SQLite database: one row per loaded table and one per object
+# cache entry, so a change writes only the rows it touched, plus key/value rows
+# for the table names and stats. Tables that were never loaded only exist in
+# the name list.
+CACHE_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS tables (name TEXT PRIMARY KEY, info BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS objects (
+    cache_type TEXT NOT NULL,
+    key TEXT NOT NULL,
+    entry BLOB NOT NULL,
+    PRIMARY KEY (cache_type, key)
+);
+"""
+# Version of what the cache rows hold; a cache written with another version is
+# discarded and rebuilt. 2: column types include length/precision.
+CACHE_FORMAT_VERSION = 2
+# Seconds between checks of the tables' last DDL times for changed tables
+DDL_CHECK_INTERVAL = 300
+# Most recently requested tables remembered across restarts and prefetched
+PREFETCH_RECENT_TABLES = 32
+PREFETCH_CONCURRENCY = 16  # Table detail loads in flight while prefetching
+PREWARM_TABLES = 200  # Largest tables loaded in one batch after startup
+# Upper bound on entries per object cache type; the least recently used entry
+# is evicted
+OBJECT_CACHE_MAX_ENTRIES = 10_000
+
+
+# Object cache types whose entries hold model objects, and how to rebuild
+# each item of an entry's data from its persisted dictionary
+OBJECT_CACHE_DECODERS = {
+    "constraints": Constraint.from_dict,
+    "indexes": Index.from_dict,
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize cache objects the stdlib json module doesn't know about"""
+    if isinstance(obj, (TableInfo, Column, Constraint, Index)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Fallback encoder built once; json.dumps constructs a new encoder on every
+# call that passes options
+_JSON_ENCODER = json.JSONEncoder(default=_json_default, separators=(",", ":"))
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize cache data to compact JSON bytes, using orjson when installed.
+
+    Constraint and Index dataclasses are serialized natively by orjson; tables
+    are passed through TableInfo.to_dict for their compact column rows.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return _JSON_ENCODER.encode(data).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes produced by _dumps"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class SchemaManager(SchemaManagerProtocol):
@@ -30,33 +105,84 @@ class SchemaManager(SchemaManagerProtocol):
             "types": 3600,  # 1 hour
             "related_tables": 1800,  # 30 minutes - relationships might change more frequently
         }
+        # SQLite connection to the cache file, only used from worker threads
+        # while holding _save_lock
+        self._db: Optional[sqlite3.Connection] = None
+        self._save_lock = asyncio.Lock()
+        # Guards the first load of the cache against concurrent callers
+        self._init_lock = asyncio.Lock()
+        # Cache object and name set last written in full, to write only changes
+        self._persisted_cache: Optional[SchemaCache] = None
+        self._persisted_names: Optional[FrozenSet[str]] = None
+        # Tables with a row in the cache database that hasn't been read yet;
+        # rows are only decoded when their table is first requested
+        self._stored_tables: Set[str] = set()
+        # Object cache entries added, replaced or dropped since the last save
+        self._dirty_objects: Dict[Tuple[str, str], None] = {}
+        # Last known DDL time per table, refreshed every DDL_CHECK_INTERVAL
+        self._ddl_times: Dict[str, float] = {}
+        self._last_ddl_check = 0.0
+        self._ddl_check_task: Optional[asyncio.Task] = None
+        # In-flight table detail loads, shared by concurrent callers
+        self._load_tasks: Dict[str, asyncio.Task] = {}
+        # Recently requested table names, oldest first, and the startup prefetch
+        self._recent_tables: Dict[str, None] = {}
+        self._prefetch_task: Optional[asyncio.Task] = None
+        # Substring index over cache.all_table_names, rebuilt whenever the
+        # cache's name set is replaced
+        self._name_index: Optional[TableNameIndex] = None
+        self._name_index_names: Optional[FrozenSet[str]] = None
+        # Column name index over the loaded tables, rebuilt after tables change
+        self._tables_version = 0
+        self._column_index: Optional[ColumnNameIndex] = None
+        self._column_index_key: Optional[Tuple[SchemaCache, int]] = None
 
     async def _initialize_cache_path(self) -> None:
         """Initialize the cache file path using the schema name"""
         schema_name = await self.db_connector.get_effective_schema()
         # Create schema-specific cache file name
-        self.cache_path = self.cache_base_path.parent / f"{schema_name.lower()}.json"
+        self.cache_path = self.cache_base_path.parent / f"{schema_name.lower()}.db"
+
+    @staticmethod
+    def plsql_cache_key(object_type: str, name_pattern: Optional[str] = None) -> str:
+        """Build the object cache key used for PL/SQL object listings"""
+        return f"{object_type}_{name_pattern or 'all'}"
 
     async def build_schema_index(self) -> Dict[str, TableInfo]:
         """
         Build a basic schema index with just table names.
         Detailed information will be loaded lazily when needed.
+
+        The PL/SQL object listings are fetched alongside the table names and
+        used to warm the 'plsql' object cache.
         """
-        all_table_names = await self.db_connector.get_all_table_names()
+        all_table_names, plsql_objects = await self.db_connector.warm_schema()
         print(f"Found {len(all_table_names)} tables in the database", file=sys.stderr)
 
-        # Initialize empty table info for each table (lazy loading)
-        schema_index = {
-            table_name: TableInfo(
+        objects_by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for obj in plsql_objects:
+            objects_by_type.setdefault(obj["type"], []).append(obj)
+        for object_type, objects in objects_by_type.items():
+            self.update_cache("plsql", self.plsql_cache_key(object_type), objects)
+
+        # Initialize empty table info for each table (lazy loading). fromkeys
+        # sizes the dict for the whole set up front, so filling it in place
+        # never triggers a resize.
+        schema_index: Dict[str, Optional[TableInfo]] = dict.fromkeys(all_table_names)
+        for table_name in schema_index:
+            schema_index[table_name] = TableInfo(
                 table_name=table_name, columns=[], relationships={}, fully_loaded=False
             )
-            for table_name in all_table_names
-        }
 
         return schema_index
 
     async def load_or_build_cache(self, force_rebuild: bool = False) -> SchemaCache:
-        """Load the schema cache from disk or rebuild it if needed"""
+        """Load the schema cache from disk or rebuild it if needed.
+
+        A cache loaded from disk is returned without checking it against the
+        database; initialize() starts that DDL check in the background, and
+        stored tables are served as they are until it completes.
+        """
         # Initialize cache path if not already set
         if self.cache_path is None:
             await self._initialize_cache_path()
@@ -67,33 +193,43 @@ class SchemaManager(SchemaManagerProtocol):
                     f"Opening existing index file for schema: {self.cache_path.stem}...",
                     file=sys.stderr,
                 )
-                with open(self.cache_path, "r") as f:
-                    data = json.load(f)
+                async with self._save_lock:
+                    stored = await asyncio.to_thread(self._read_cache_db)
+                if stored is not None:
+                    meta, stored_tables = stored
                     print("Loading index in memory...", file=sys.stderr)
-                    # Load main schema cache
+                    # Names are saved sorted, so sorting them again is a linear pass
+                    sorted_names = tuple(sorted(meta["all_table_names"]))
+                    self._stored_tables = stored_tables
                     cache = SchemaCache(
-                        tables={
-                            k: TableInfo(**{**v, "table_name": k})
-                            for k, v in data["tables"].items()
-                        },
-                        last_updated=data["last_updated"],
-                        all_table_names=set(data.get("all_table_names", [])),
+                        tables={},
+                        last_updated=meta["last_updated"],
+                        all_table_names=frozenset(sorted_names),
+                        _sorted_names=sorted_names,
                     )
 
                     # Load additional object caches if they exist
-                    if "object_cache" in data:
-                        self.object_cache = data["object_cache"]
-                    if "cache_stats" in data:
-                        self.cache_stats = data["cache_stats"]
+                    if "object_cache" in meta:
+                        self.object_cache = meta["object_cache"]
+                    if "cache_stats" in meta:
+                        self.cache_stats = meta["cache_stats"]
+                    self._recent_tables = dict.fromkeys(meta.get("recent_tables", ()))
 
+                    self._persisted_cache = cache
+                    self._persisted_names = cache.all_table_names
                     return cache
-            except (json.JSONDecodeError, KeyError) as e:
+            except (ValueError, KeyError, sqlite3.DatabaseError) as e:
                 print(f"Error loading cache: {e}", file=sys.stderr)
-                # Fall through to rebuild
+                # Start over from an empty file and fall through to rebuild
+                async with self._save_lock:
+                    await asyncio.to_thread(self._discard_cache_db)
 
-        # Build new cache
-        tables = await self.build_schema_index()
-        all_table_names = set(tables.keys())
+        # Build new cache; the DDL times are only recorded since every table
+        # starts out unloaded
+        tables, _ = await asyncio.gather(
+            self.build_schema_index(), self._refresh_ddl_times()
+        )
+        all_table_names = frozenset(tables)
         print("Loading index in memory...", file=sys.stderr)
         cache = SchemaCache(
             tables=tables, last_updated=time.time(), all_table_names=all_table_names
@@ -104,7 +240,13 @@ class SchemaManager(SchemaManagerProtocol):
         return cache
 
     async def save_cache(self, cache: Optional[SchemaCache] = None) -> None:
-        """Save the current cache to disk"""
+        """Save the current cache to disk.
+
+        Loaded tables are written as they are loaded, so a save only writes
+        the object cache entries changed since the last save and the stats,
+        plus the table names when they changed. All table and object rows are
+        rewritten only for a cache that was never saved.
+        """
         cache_to_save = cache or self.cache
         if not cache_to_save or not self.cache_path:
             return
@@ -113,27 +255,309 @@ class SchemaManager(SchemaManagerProtocol):
             f"Saving updated index to disk for schema: {self.cache_path.stem}...",
             file=sys.stderr,
         )
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_path, "w") as f:
-            json.dump(
-                {
-                    "tables": {k: v.__dict__ for k, v in cache_to_save.tables.items()},
-                    "last_updated": cache_to_save.last_updated,
-                    "all_table_names": list(cache_to_save.all_table_names),
-                    "object_cache": self.object_cache,
-                    "cache_stats": self.cache_stats,
-                },
-                f,
-                indent=2,
+        meta = {
+            "format_version": _dumps(CACHE_FORMAT_VERSION),
+            "last_updated": _dumps(cache_to_save.last_updated),
+            "cache_stats": _dumps(self.cache_stats),
+            "recent_tables": _dumps(list(self._recent_tables)),
+        }
+        names = cache_to_save.all_table_names
+        if names is not self._persisted_names:
+            meta["all_table_names"] = _dumps(cache_to_save.sorted_table_names())
+        replace_tables = cache_to_save is not self._persisted_cache
+        tables = (
+            [info for info in cache_to_save.tables.values() if info.fully_loaded]
+            if replace_tables
+            else []
+        )
+
+        # Only changed object cache entries are encoded; the rest of each
+        # object cache already sits unchanged in its rows
+        if replace_tables:
+            object_keys = [
+                (cache_type, key)
+                for cache_type, entries in self.object_cache.items()
+                for key in entries
+            ]
+        else:
+            object_keys = list(self._dirty_objects)
+        self._dirty_objects.clear()
+        objects = []
+        removed_objects = []
+        for cache_type, key in object_keys:
+            entry = self.object_cache.get(cache_type, {}).get(key)
+            if entry is None:
+                removed_objects.append((cache_type, key))
+            else:
+                objects.append((cache_type, key, _dumps(entry)))
+
+        # Serialize concurrent saves so an older snapshot can't land last
+        async with self._save_lock:
+            # Write from a worker thread so the event loop keeps serving requests
+            await asyncio.to_thread(
+                self._write_cache_db,
+                meta,
+                tables,
+                (),
+                replace_tables,
+                objects,
+                removed_objects,
             )
+        if replace_tables:
+            self._stored_tables = set()
+        self._persisted_cache = cache_to_save
+        self._persisted_names = names
         print("Index saved!", file=sys.stderr)
 
+    def _cache_db(self) -> sqlite3.Connection:
+        """Return the connection to the cache database, opening it if needed"""
+        if self._db is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(
+                self.cache_path, isolation_level=None, check_same_thread=False
+            )
+            try:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                db.executescript(CACHE_DB_SCHEMA)
+            except sqlite3.Error:
+                db.close()
+                raise
+            self._db = db
+        return self._db
+
+    def _read_cache_db(self) -> Optional[Tuple[Dict[str, Any], Set[str]]]:
+        """Read the metadata, object caches and stored table names, or None for
+        an empty database.
+
+        Table rows are left on disk; only the names of the stored tables are
+        read, and each row is decoded by _read_table_row on first use.
+        """
+        db = self._cache_db()
+        meta = {key: _loads(value) for key, value in db.execute("SELECT key, value FROM meta")}
+        if "last_updated" not in meta:
+            return None
+        if meta.get("format_version") != CACHE_FORMAT_VERSION:
+            raise ValueError("cache was written in an older format")
+        # Intern the names so the name set, the tables dict and each TableInfo
+        # share one string object per table instead of one per parsed copy
+        meta["all_table_names"] = list(map(sys.intern, meta["all_table_names"]))
+        stored_tables = {sys.intern(name) for (name,) in db.execute("SELECT name FROM tables")}
+
+        # Rebuild each object cache oldest write first; reads only reorder the
+        # entries in memory, so this is the best stand-in for last use
+        object_cache: Dict[str, Dict[str, Any]] = {}
+        for cache_type, key, entry in db.execute(
+            "SELECT cache_type, key, entry FROM objects"
+        ):
+            entry = _loads(entry)
+            decode = OBJECT_CACHE_DECODERS.get(cache_type)
+            if decode is not None:
+                entry["data"] = [decode(item) for item in entry["data"]]
+            object_cache.setdefault(cache_type, {})[key] = entry
+        for cache_type, entries in object_cache.items():
+            object_cache[cache_type] = dict(
+                sorted(entries.items(), key=lambda item: item[1].get("timestamp", 0))
+            )
+        meta["object_cache"] = {**self.object_cache, **object_cache}
+        return meta, stored_tables
+
+    def _read_table_row(self, table_name: str) -> Optional[TableInfo]:
+        """Decode one stored table row, or None when it's gone"""
+        row = self._cache_db().execute(
+            "SELECT info FROM tables WHERE name = ?", (table_name,)
+        ).fetchone()
+        if row is None:
+            return None
+        return TableInfo.from_dict(table_name, _loads(row[0]))
+
+    def _write_cache_db(
+        self,
+        meta: Dict[str, bytes],
+        tables: Iterable[TableInfo],
+        removed: Iterable[str],
+        replace_tables: bool = False,
+        objects: Iterable[Tuple[str, str, bytes]] = (),
+        removed_objects: Iterable[Tuple[str, str]] = (),
+    ) -> None:
+        """Write metadata, table and object cache rows in a single transaction"""
+        db = self._cache_db()
+        db.execute("BEGIN")
+        try:
+            if replace_tables:
+                db.execute("DELETE FROM tables")
+                db.execute("DELETE FROM objects")
+            db.executemany(
+                "INSERT OR REPLACE INTO objects (cache_type, key, entry) VALUES (?, ?, ?)",
+                objects,
+            )
+            db.executemany(
+                "DELETE FROM objects WHERE cache_type = ? AND key = ?", removed_objects
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO tables (name, info) VALUES (?, ?)",
+                ((info.table_name, _dumps(info.to_dict())) for info in tables),
+            )
+            db.executemany(
+                "DELETE FROM tables WHERE name = ?", ((name,) for name in removed)
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", meta.items()
+            )
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _discard_cache_db(self) -> None:
+        """Close and delete an unreadable cache database"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.cache_path}{suffix}").unlink(missing_ok=True)
+        self._persisted_cache = None
+        self._persisted_names = None
+        self._stored_tables = set()
+
+    async def _store_table(
+        self, table_name: str, table_info: Optional[TableInfo]
+    ) -> None:
+        """Persist a single table row as soon as it changes.
+
+        A loaded table_info is written; an unloaded or None table_info (the
+        table changed or no longer exists) removes the row. The table names are
+        written along with it when they changed.
+        """
+        if table_info is not None and table_info.fully_loaded:
+            await self._store_tables((table_info,))
+        else:
+            await self._store_tables((), (table_name,))
+
+    async def _store_tables(
+        self, tables: Iterable[TableInfo], removed: Iterable[str] = ()
+    ) -> None:
+        """Persist loaded table rows and drop removed ones in one transaction"""
+        self._tables_version += 1
+        if self.cache_path is None:
+            return
+
+        tables = list(tables)
+        removed = list(removed)
+        # The rows are replaced by what's now in memory, or gone
+        self._stored_tables.difference_update(info.table_name for info in tables)
+        self._stored_tables.difference_update(removed)
+
+        meta: Dict[str, bytes] = {}
+        cache = self.cache
+        if cache is not None and cache.all_table_names is not self._persisted_names:
+            meta["all_table_names"] = _dumps(cache.sorted_table_names())
+        async with self._save_lock:
+            await asyncio.to_thread(self._write_cache_db, meta, tables, removed)
+        if meta:
+            self._persisted_names = cache.all_table_names
+
+    async def check_schema_changes(self, cache: Optional[SchemaCache] = None) -> int:
+        """Invalidate cached tables whose DDL changed since they were loaded.
+
+        Loaded tables carry the DDL time they were loaded at. A changed table
+        of the live cache keeps being served while its details are reloaded in
+        the background; while a cache is being loaded at startup it is reset
+        to an unloaded entry instead. A table that no longer exists is dropped
+        and new tables are added to the name index. Unchanged tables stay
+        cached without any expiry.
+
+        Returns:
+            Number of cached tables that were invalidated or dropped
+        """
+        ddl_times = await self._refresh_ddl_times()
+        cache = cache or self.cache
+        if ddl_times is None or cache is None:
+            return 0
+
+        changed = 0
+        for table_name, table_info in list(cache.tables.items()):
+            if not table_info.fully_loaded:
+                continue
+            ddl_time = ddl_times.get(table_name)
+            if ddl_time == table_info.ddl_time:
+                continue
+            if ddl_time is None:
+                del cache.tables[table_name]
+                await self._store_table(table_name, None)
+            elif cache is self.cache:
+                self._load_table(table_name).add_done_callback(
+                    self._report_refresh_error
+                )
+            else:
+                placeholder = TableInfo(
+                    table_name=table_name, columns=[], relationships={}
+                )
+                cache.tables[table_name] = placeholder
+                await self._store_table(table_name, placeholder)
+            changed += 1
+
+        # Rows not read yet are checked against their DDL time when they are;
+        # rows of tables that no longer exist are dropped right away
+        dropped = [name for name in self._stored_tables if name not in ddl_times]
+        if dropped:
+            await self._store_tables((), dropped)
+            changed += len(dropped)
+
+        names_changed = cache.update_table_names(
+            added=ddl_times,
+            removed=[name for name in cache.all_table_names if name not in ddl_times],
+        )
+        if names_changed:
+            await self.save_cache(cache)
+        if changed:
+            print(f"Invalidated {changed} tables changed by DDL", file=sys.stderr)
+        return changed
+
+    async def _refresh_ddl_times(self) -> Optional[Dict[str, float]]:
+        """Fetch and record the current DDL time of every table"""
+        try:
+            ddl_times = await self.db_connector.get_table_ddl_times()
+        except Exception as e:
+            print(f"Error checking table DDL times: {str(e)}", file=sys.stderr)
+            return None
+        self._ddl_times = ddl_times
+        self._last_ddl_check = time.time()
+        return ddl_times
+
+    def _schedule_ddl_check(self) -> None:
+        """Start a background DDL check when the last one is old enough"""
+        if time.time() - self._last_ddl_check < DDL_CHECK_INTERVAL:
+            return
+        if self._ddl_check_task is not None and not self._ddl_check_task.done():
+            return
+        self._ddl_check_task = asyncio.create_task(self.check_schema_changes())
+
+    async def close(self) -> None:
+        """Stop background work, save the object caches and close the cache database"""
+        # Wait for cancelled tasks to unwind so their pooled connections are
+        # released before the pool itself is closed
+        tasks = [
+            task
+            for task in (self._ddl_check_task, self._prefetch_task, *self._load_tasks.values())
+            if task is not None and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._ddl_check_task = self._prefetch_task = None
+        await self.save_cache()
+        async with self._save_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
     async def get_schema_info(self, table_name: str) -> Optional[TableInfo]:
         """Get schema information for a specific table, loading it if necessary"""
-        if not self.cache:
-            self.cache = await self.load_or_build_cache()
+        await self._ensure_cache()
 
-        table_name = table_name.upper()
+        table_name = canonical_name(table_name)
+        self._schedule_ddl_check()
 
         # Check if we know about this table
         if table_name not in self.cache.all_table_names:
@@ -142,48 +566,243 @@ class SchemaManager(SchemaManagerProtocol):
         # Check if we have the table in our cache
         if table_name not in self.cache.tables:
             self.cache.tables[table_name] = TableInfo(
-                columns=[], relationships={}, fully_loaded=False
+                table_name=table_name, columns=[], relationships={}, fully_loaded=False
             )
 
-        # If the table isn't fully loaded, load it now
+        self._recent_tables.pop(table_name, None)
+        self._recent_tables[table_name] = None
+        if len(self._recent_tables) > PREFETCH_RECENT_TABLES:
+            del self._recent_tables[next(iter(self._recent_tables))]
+
+        # If the table isn't fully loaded, load it now. The load is shielded
+        # so a cancelled caller doesn't abort it for others waiting on it.
         if not self.cache.tables[table_name].fully_loaded:
-            print(f"Lazily loading details for table {table_name}...", file=sys.stderr)
-            table_details = await self.db_connector.load_table_details(table_name)
+            return await asyncio.shield(self._load_table(table_name))
+
+        return self.cache.tables.get(table_name)
+
+    async def get_schema_info_many(
+        self, table_names: Iterable[str]
+    ) -> List[Union[Optional[TableInfo], BaseException]]:
+        """Get schema information for several tables, in the given order.
+
+        Tables that aren't loaded yet are fetched together with one
+        load_many_table_details call rather than one load per table. Like
+        asyncio.gather(return_exceptions=True), a failed load is returned in
+        place of its table.
+        """
+        await self._ensure_cache()
+
+        names = [canonical_name(name) for name in table_names]
+        cache = self.cache
+        pending = [
+            name
+            for name in dict.fromkeys(names)
+            if name in cache.all_table_names
+            and name not in self._load_tasks
+            and name not in self._stored_tables
+            and not (name in cache.tables and cache.tables[name].fully_loaded)
+        ]
+        if len(pending) > 1:
+            self._load_tables(pending)
+
+        # Each lookup picks up its table's share of the batch from _load_tasks
+        return await asyncio.gather(
+            *(self.get_schema_info(name) for name in names), return_exceptions=True
+        )
+
+    async def prefetch(
+        self, names: Iterable[str], concurrency: int = PREFETCH_CONCURRENCY
+    ) -> int:
+        """Load the details of several tables into the cache ahead of use.
+
+        Tables that need a database load are fetched together with one
+        load_many_table_details call, running at most `concurrency` per-table
+        loads at once; tables that are already loaded or unknown are skipped,
+        and loads already in flight are shared.
+
+        Returns:
+            Number of tables that were loaded
+        """
+        await self._ensure_cache()
+
+        names = [
+            name
+            for name in dict.fromkeys(map(canonical_name, names))
+            if name in self.cache.all_table_names
+            and not (name in self.cache.tables and self.cache.tables[name].fully_loaded)
+        ]
+        if not names:
+            return 0
+
+        pending = [
+            name
+            for name in names
+            if name not in self._load_tasks and name not in self._stored_tables
+        ]
+        if len(pending) > 1:
+            self._load_tables(pending, concurrency)
+
+        loaded = 0
+        for future in asyncio.as_completed(
+            [asyncio.shield(self._load_table(name)) for name in names]
+        ):
+            try:
+                if await future is not None:
+                    loaded += 1
+            except Exception as e:
+                print(f"Error prefetching table details: {str(e)}", file=sys.stderr)
+        return loaded
+
+    async def prewarm(self, top_n: int = PREWARM_TABLES) -> int:
+        """Load the largest tables not yet cached with one batched fetch.
+
+        Meant to run in the background after startup so the tables most
+        likely to be asked about are already loaded; errors are logged.
+
+        Returns:
+            Number of tables that were loaded
+        """
+        try:
+            await self._ensure_cache()
+            cache = self.cache
+            names = [
+                name
+                for name in await self.db_connector.get_largest_table_names(top_n)
+                if name in cache.all_table_names
+                and name not in self._load_tasks
+                and name not in self._stored_tables
+                and not (name in cache.tables and cache.tables[name].fully_loaded)
+            ]
+            if not names:
+                return 0
+
+            print(f"Prewarming details for {len(names)} tables...", file=sys.stderr)
+            details = await self.db_connector.load_many_table_details(names)
+            loaded = []
+            for name, table_details in details.items():
+                # Skip tables loaded or replaced by a rebuild meanwhile
+                if cache is not self.cache or name in self._load_tasks:
+                    continue
+                table_info = TableInfo.from_dict(
+                    name, {**table_details, "fully_loaded": True}
+                )
+                table_info.ddl_time = self._ddl_times.get(name)
+                cache.tables[name] = table_info
+                loaded.append(table_info)
+            if loaded:
+                await self._store_tables(loaded)
+            return len(loaded)
+        except Exception as e:
+            print(f"Error prewarming table details: {str(e)}", file=sys.stderr)
+            return 0
+
+    def _load_table(self, table_name: str) -> asyncio.Task:
+        """Return the in-flight detail load for a table, starting one if needed"""
+        task = self._load_tasks.get(table_name)
+        if task is None:
+            task = asyncio.create_task(self._fetch_table(table_name))
+            self._load_tasks[table_name] = task
+        return task
+
+    def _load_tables(
+        self, table_names: List[str], concurrency: int = PREFETCH_CONCURRENCY
+    ) -> None:
+        """Start one batched detail load for tables that have none in flight.
+
+        Each table still gets its own task in _load_tasks, so callers wait on
+        and share it exactly like a single-table load.
+        """
+        print(f"Loading details for {len(table_names)} tables...", file=sys.stderr)
+        batch = asyncio.create_task(
+            self.db_connector.load_many_table_details(table_names, concurrency)
+        )
+        for table_name in table_names:
+            self._load_tasks[table_name] = asyncio.create_task(
+                self._fetch_table(table_name, batch)
+            )
+
+    async def _fetch_table(
+        self, table_name: str, batch: Optional[asyncio.Task] = None
+    ) -> Optional[TableInfo]:
+        """Load a table's details into the cache and persist the result.
+
+        With a batch, the details are taken from that batched load instead of
+        being queried for this table alone.
+        """
+        try:
+            if batch is None and table_name in self._stored_tables:
+                table_info = await self._load_stored_table(table_name)
+                if table_info is not None:
+                    self.cache.tables[table_name] = table_info
+                    self._tables_version += 1
+                    return table_info
+
+            if batch is None:
+                print(f"Lazily loading details for table {table_name}...", file=sys.stderr)
+                table_details = await self.db_connector.load_table_details(table_name)
+            else:
+                # Shielded: the batch is shared by the other tables' tasks
+                table_details = (await asyncio.shield(batch)).get(table_name)
             if table_details:
-                table_info = TableInfo(
-                    table_name=table_name,
-                    columns=table_details["columns"],
-                    relationships=table_details["relationships"],
-                    fully_loaded=True,
+                table_info = TableInfo.from_dict(
+                    table_name, {**table_details, "fully_loaded": True}
                 )
+                table_info.ddl_time = self._ddl_times.get(table_name)
                 self.cache.tables[table_name] = table_info
-                # Save the updated cache to disk
-                await self.save_cache()
-            else:
-                # Table doesn't actually exist, remove it from our cache
-                self.cache.tables.pop(table_name, None)
-                self.cache.all_table_names.discard(table_name)
-                await self.save_cache()
-                return None
+                # Write just this table's row instead of rewriting the whole cache
+                await self._store_table(table_name, table_info)
+                return table_info
 
-        return self.cache.tables.get(table_name)
+            # Table doesn't actually exist, remove it from our cache
+            self.cache.tables.pop(table_name, None)
+            self.cache.update_table_names(removed=(table_name,))
+            await self._store_table(table_name, None)
+            return None
+        finally:
+            self._load_tasks.pop(table_name, None)
+
+    async def _load_stored_table(self, table_name: str) -> Optional[TableInfo]:
+        """Read a table's row from the cache database if it's still current.
+
+        A row whose table changed by DDL since it was stored is discarded, so
+        the caller loads the table from the database instead. Until the first
+        DDL check completes, rows are served as stored.
+        """
+        async with self._save_lock:
+            table_info = await asyncio.to_thread(self._read_table_row, table_name)
+        self._stored_tables.discard(table_name)
+        if table_info is None:
+            return None
+        if self._last_ddl_check and self._ddl_times.get(table_name) != table_info.ddl_time:
+            return None
+        return table_info
+
+    @staticmethod
+    def _report_refresh_error(task: asyncio.Task) -> None:
+        """Log a failed background table refresh; the stale entry stays cached"""
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error refreshing table details: {task.exception()}", file=sys.stderr)
+
+    def _table_name_index(self) -> TableNameIndex:
+        """Return the name index for the current cache, rebuilding it if stale"""
+        names = self.cache.all_table_names
+        if self._name_index is None or self._name_index_names is not names:
+            self._name_index = TableNameIndex(self.cache.sorted_table_names())
+            self._name_index_names = names
+        return self._name_index
 
     async def search_tables(self, search_term: str, limit: int = 20) -> List[str]:
         """
         Search for table names matching the search term.
         First searches in cache, then falls back to database search if needed.
         """
-        if not self.cache:
-            self.cache = await self.load_or_build_cache()
+        await self._ensure_cache()
 
         search_term = search_term.upper()
 
-        # First try exact/substring matches in cache
-        matching_tables = [
-            table_name
-            for table_name in self.cache.all_table_names
-            if search_term in table_name
-        ]
+        # First try substring matches in the cached table index
+        matching_tables = self._table_name_index().search(search_term, limit)
 
         # If we don't have enough results, search in the database
         if len(matching_tables) < limit:
@@ -199,8 +818,7 @@ class SchemaManager(SchemaManagerProtocol):
                 matching_tables.extend(new_tables)
 
                 # Update cache with any new tables found
-                if new_tables:
-                    self.cache.all_table_names.update(new_tables)
+                if self.cache.update_table_names(added=new_tables):
                     await self.save_cache()
 
             except Exception as e:
@@ -209,40 +827,177 @@ class SchemaManager(SchemaManagerProtocol):
         # Return the first 'limit' matching tables
         return matching_tables[:limit]
 
+    async def search_tables_multi(
+        self, search_terms: List[str], limit: int = 20
+    ) -> List[str]:
+        """
+        Search for table names matching any of several terms.
+
+        Returns at most `limit` distinct names, the matches of earlier terms
+        first. The cached index answers the terms in order until `limit` names
+        are collected; later terms aren't searched at all, and the terms still
+        short of `limit` matches share a single database query.
+        """
+        await self._ensure_cache()
+
+        index = self._table_name_index()
+        collected: Dict[str, None] = {}
+        matches_by_term: Dict[str, List[str]] = {}
+        for term in dict.fromkeys(term.upper() for term in search_terms):
+            # The database only adds matches to earlier terms, so once the
+            # index alone fills the limit no later term can make the cut
+            if len(collected) >= limit:
+                break
+            matches = matches_by_term[term] = index.search(term, limit)
+            collected.update(dict.fromkeys(matches))
+
+        short_terms = [
+            term for term, matches in matches_by_term.items() if len(matches) < limit
+        ]
+        if short_terms:
+            try:
+                db_results = await self.db_connector.search_in_database_multi(
+                    short_terms, limit
+                )
+                new_tables = []
+                for term, tables in db_results.items():
+                    matches = matches_by_term[term]
+                    for table in tables:
+                        if len(matches) >= limit:
+                            break
+                        if table not in matches:
+                            matches.append(table)
+                            new_tables.append(table)
+
+                # Update cache with any new tables found
+                if self.cache.update_table_names(added=new_tables):
+                    await self.save_cache()
+
+            except Exception as e:
+                print(f"Error during database table search: {str(e)}", file=sys.stderr)
+
+        # Merge per-term results in term order without duplicates
+        return list(
+            islice(
+                dict.fromkeys(
+                    table for matches in matches_by_term.values() for table in matches
+                ),
+                limit,
+            )
+        )
+
+    def _column_name_index(self) -> ColumnNameIndex:
+        """Return the column index for the loaded tables, rebuilding it if stale"""
+        key = self._column_index_key
+        if (
+            self._column_index is None
+            or key[0] is not self.cache
+            or key[1] != self._tables_version
+        ):
+            self._column_index = ColumnNameIndex(self.cache.tables)
+            self._column_index_key = (self.cache, self._tables_version)
+        return self._column_index
+
     async def search_columns(
         self, search_term: str, limit: int = 50
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """Search for columns matching the given pattern across all tables"""
-        if not self.cache:
-            await self.initialize()
+    ) -> Dict[str, List[Column]]:
+        """Search for columns matching the given pattern across all tables.
+
+        Once every table is loaded the column name index answers on its own;
+        otherwise the database is searched as well. Both match the term as a
+        literal substring, and either way the result holds the first `limit`
+        matching tables in name order, each with its columns in column order.
+        """
+        await self._ensure_cache()
 
         search_term = search_term.upper()
 
-        # Search directly in database for all tables
-        try:
-            result = await self.db_connector.search_columns_in_database(search_term)
-            return dict(list(result.items())[:limit])
-        except Exception as e:
-            print(f"Error during database column search: {str(e)}", file=sys.stderr)
-            return {}
+        index = self._column_name_index()
+        result = index.search(search_term)
+        if index.table_count < len(self.cache.all_table_names):
+            # Tables that aren't loaded yet can only be searched in the database
+            try:
+                db_result = await self.db_connector.search_columns_in_database(
+                    search_term, limit
+                )
+            except Exception as e:
+                print(f"Error during database column search: {str(e)}", file=sys.stderr)
+            else:
+                for table_name, columns in db_result.items():
+                    result.setdefault(table_name, columns)
+
+        return {table_name: result[table_name] for table_name in sorted(result)[:limit]}
+
+    async def _ensure_cache(self) -> None:
+        """Load or build the cache once, however many callers need it at once"""
+        if self.cache is not None:
+            return
+        async with self._init_lock:
+            if self.cache is None:
+                self.cache = await self.load_or_build_cache()
 
     async def initialize(self) -> None:
         """Initialize the database context and build initial cache"""
-        self.cache = await self.load_or_build_cache()
+        await self._ensure_cache()
         if not self.cache:
             raise RuntimeError("Failed to initialize schema cache")
 
-    def is_cache_valid(self, cache_type: str, key: str) -> bool:
-        """Check if a cached item is still valid based on TTL"""
-        if (
-            cache_type not in self.object_cache
-            or key not in self.object_cache[cache_type]
-            or "timestamp" not in self.object_cache[cache_type][key]
-        ):
-            return False
-        return (
-            time.time() - self.object_cache[cache_type][key]["timestamp"]
-        ) < self.ttl[cache_type]
+        # A cache opened from disk hasn't been checked for DDL changes yet;
+        # check it in the background instead of making startup wait for it
+        self._schedule_ddl_check()
+
+        # Reload recently used tables that aren't cached (e.g. changed by DDL)
+        # in the background so the first requests for them are cache hits
+        self._start_prefetch()
+
+    async def rebuild_cache(self) -> SchemaCache:
+        """Rebuild the cache from the database, dropping every loaded table.
+
+        The object caches (constraints, indexes, ...) are dropped as well, so
+        nothing fetched before the rebuild outlives it; the PL/SQL listings
+        are warmed again by the rebuild itself. The recently used tables are
+        then reloaded concurrently in the background, so the rebuild doesn't
+        leave all of them cold.
+        """
+        for entries in self.object_cache.values():
+            entries.clear()
+        self._dirty_objects.clear()
+        self.cache = await self.load_or_build_cache(force_rebuild=True)
+        self._start_prefetch()
+        return self.cache
+
+    def _start_prefetch(self) -> None:
+        """Start loading the recently used tables, replacing an older prefetch"""
+        if not self._recent_tables:
+            return
+        if self._prefetch_task is not None:
+            # Its table list was taken before the cache it checked was replaced
+            self._prefetch_task.cancel()
+        self._prefetch_task = asyncio.create_task(
+            self.prefetch(list(self._recent_tables))
+        )
+
+    def get_cached(self, cache_type: str, key: str) -> Optional[Any]:
+        """Return cached data if present and within its TTL, otherwise None.
+
+        Expired entries are dropped on access so they don't linger in memory
+        or get persisted again. A hit moves the entry to the end of its cache,
+        so update_cache evicts the least recently used entry.
+        """
+        entries = self.object_cache.get(cache_type)
+        if not entries:
+            return None
+        entry = entries.get(key)
+        if entry is None or "timestamp" not in entry:
+            return None
+        if time.time() - entry["timestamp"] >= self.ttl[cache_type]:
+            del entries[key]
+            self._dirty_objects[(cache_type, key)] = None
+            return None
+        # Only the in-memory order changes; a reloaded cache starts out
+        # ordered by write time
+        entries[key] = entries.pop(key)
+        return entry["data"]
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -258,5 +1013,14 @@ class SchemaManager(SchemaManagerProtocol):
         }
 
     def update_cache(self, cache_type: str, key: str, data: Any) -> None:
-        """Update cache with new data"""
-        self.object_cache[cache_type][key] = {"data": data, "timestamp": time.time()}
+        """Update cache with new data, evicting the least recently used when full"""
+        entries = self.object_cache.setdefault(cache_type, {})
+        # Re-insert so entries stay ordered by last use and the first is the
+        # least recently used
+        entries.pop(key, None)
+        entries[key] = {"data": data, "timestamp": time.time()}
+        self._dirty_objects[(cache_type, key)] = None
+        if len(entries) > OBJECT_CACHE_MAX_ENTRIES:
+            evicted = next(iter(entries))
+            del entries[evicted]
+            self._dirty_objects[(cache_type, evicted)] = None
@@ -0,0 +1,108 @@
+"""Substring search indexes over table and column names.
+
+Table names are kept in a sorted tuple, and every trigram (three-character
+slice) of every name maps to the positions of the names containing it. A search
+term of three or more characters only has to verify the names listed under its
+rarest trigram instead of scanning the whole set, and every search stops as
+soon as `limit` matches are found.
+
+Column names are indexed by their distinct upper-cased name, so a search tests
+each distinct name once rather than every column of every table.
+"""
+from array import array
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..models import Column, TableInfo
+
+NGRAM_SIZE = 3
+
+
+def _ngrams(value: str) -> Iterable[str]:
+    """Yield every distinct trigram of the given string."""
+    return {value[i : i + NGRAM_SIZE] for i in range(len(value) - NGRAM_SIZE + 1)}
+
+
+class TableNameIndex:
+    """Immutable trigram index answering substring queries over table names."""
+
+    __slots__ = ("names", "_postings")
+
+    def __init__(self, names: Iterable[str]):
+        self.names: Tuple[str, ...] = tuple(sorted(names))
+        postings: Dict[str, array] = {}
+        for position, name in enumerate(self.names):
+            for gram in _ngrams(name):
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("i")
+                posting.append(position)
+        self._postings = postings
+
+    def search(self, term: str, limit: Optional[int] = None) -> List[str]:
+        """Return names containing `term` in sorted order, at most `limit` of them.
+
+        The term is expected to be upper-cased like the indexed names.
+        """
+        if limit is not None and limit <= 0:
+            return []
+
+        if len(term) < NGRAM_SIZE:
+            candidates: Iterable[str] = self.names
+        else:
+            rarest: Optional[array] = None
+            for gram in _ngrams(term):
+                posting = self._postings.get(gram)
+                if posting is None:
+                    return []
+                if rarest is None or len(posting) < len(rarest):
+                    rarest = posting
+            candidates = (self.names[position] for position in rarest)
+
+        matches: List[str] = []
+        for name in candidates:
+            if term in name:
+                matches.append(name)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+
+class ColumnNameIndex:
+    """Immutable index from upper-cased column names to the loaded tables using them."""
+
+    __slots__ = ("_columns", "table_count")
+
+    def __init__(self, tables: Mapping[str, "TableInfo"]):
+        # Each entry keeps the column's position so matches can be returned in
+        # the table's column order, like the database search
+        columns: Dict[str, List[Tuple[str, int, "Column"]]] = {}
+        table_count = 0
+        for table_name, table_info in tables.items():
+            if not table_info.fully_loaded:
+                continue
+            table_count += 1
+            for position, column in enumerate(table_info.columns):
+                columns.setdefault(column.name.upper(), []).append(
+                    (table_name, position, column)
+                )
+        self._columns = columns
+        # Number of loaded tables indexed
+        self.table_count = table_count
+
+    def search(self, term: str) -> Dict[str, List["Column"]]:
+        """Return the matching columns of every loaded table, keyed by table name.
+
+        The term is expected to be upper-cased and is matched as a literal
+        substring. Each table's columns are in column order.
+        """
+        matches: Dict[str, List[Tuple[int, "Column"]]] = {}
+        for name, entries in self._columns.items():
+            if term in name:
+                for table_name, position, column in entries:
+                    matches.setdefault(table_name, []).append((position, column))
+        return {
+            table_name: [column for _, column in sorted(entries, key=itemgetter(0))]
+            for table_name, entries in matches.items()
+        }
@@ -1,17 +1,22 @@
 from mcp.server.fastmcp import FastMCP, Context
+import asyncio
 import json
+import logging
 import os
+import re
 import sys
-from typing import Dict, List, AsyncIterator, Optional
+from typing import Any, Dict, Iterable, Iterator, List, AsyncIterator, Optional, Tuple
 import time
 from contextlib import asynccontextmanager
+from itertools import chain
 from pathlib import Path
 from dotenv import load_dotenv
-import uuid  # retained for potential future use elsewhere
 import oracledb
 
 from db_context import DatabaseContext
-from db_context.utils import wrap_untrusted
+from db_context.database import SUPPORTED_OBJECT_TYPES
+from db_context.models import Column, Constraint, Index, TableInfo
+from db_context.utils import canonical_name, wrap_untrusted
 from db_context.schema.formatter import format_sql_query_result
 
 # Load environment variables from .env file
@@ -20,6 +25,8 @@ load_dotenv()
 ORACLE_CONNECTION_STRING = os.getenv("ORACLE_CONNECTION_STRING")
 TARGET_SCHEMA = os.getenv("TARGET_SCHEMA")  # Optional schema override
 CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+# The schema manager names the actual file after the schema, in this directory
+SCHEMA_CACHE_PATH = Path(CACHE_DIR) / "schema_cache.db"
 USE_THICK_MODE = os.getenv("THICK_MODE", "").lower() in (
     "true",
     "1",
@@ -28,45 +35,64 @@ USE_THICK_MODE = os.getenv("THICK_MODE", "").lower() in (
 READ_ONLY_MODE = os.getenv("READ_ONLY_MODE", "true").lower() not in ("false", "0", "no")
 ORACLE_CLIENT_LIB_DIR = os.getenv("ORACLE_CLIENT_LIB_DIR", None)
 
+# stdout carries the MCP protocol, so diagnostics go to stderr
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    stream=sys.stderr,
+    format="%(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Separators between the terms given to search_tables_schema
+_SEARCH_TERM_SPLIT_RE = re.compile(r"[,\s]+")
+
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[DatabaseContext]:
     """Manage application lifecycle and ensure DatabaseContext is properly initialized"""
-    print("App Lifespan initialising", file=sys.stderr)
+    logger.info("App Lifespan initialising")
     connection_string = ORACLE_CONNECTION_STRING
     if not connection_string:
         raise ValueError(
             "ORACLE_CONNECTION_STRING environment variable is required. Set it in .env file or environment."
         )
 
-    cache_dir = Path(CACHE_DIR)
-    cache_dir.mkdir(parents=True, exist_ok=True)
-
+    # The cache directory is created when the cache database is first opened
     db_context = DatabaseContext(
         connection_string=connection_string,
-        cache_path=cache_dir / "schema_cache.json",
+        cache_path=SCHEMA_CACHE_PATH,
         target_schema=TARGET_SCHEMA,
         use_thick_mode=USE_THICK_MODE,  # Pass the thick mode setting
         lib_dir=ORACLE_CLIENT_LIB_DIR,
         read_only=READ_ONLY_MODE,
     )
 
-    try:
-        # Initialize cache on startup
-        print("Initialising database cache...", file=sys.stderr)
-        await db_context.initialize()
-        print("Cache ready!", file=sys.stderr)
-        yield db_context
-    finally:
-        # Ensure proper cleanup of database resources
-        print("Closing database connections...", file=sys.stderr)
-        await db_context.close()
-        print("Database connections closed", file=sys.stderr)
+    # The context owns the connection pool: it is opened (and the cache
+    # loaded) on entry and closed on exit, even if startup fails halfway
+    logger.info("Initialising database cache...")
+    async with db_context:
+        logger.info("Cache ready!")
+        # Load the largest tables in the background so the first requests
+        # for them don't wait on Oracle
+        prewarm_task = asyncio.create_task(db_context.prewarm())
+        try:
+            yield db_context
+        finally:
+            prewarm_task.cancel()
+            await asyncio.gather(prewarm_task, return_exceptions=True)
+            logger.info("Closing database connections...")
+    logger.info("Database connections closed")
 
 
 # Initialize FastMCP server
 mcp = FastMCP("oracle", lifespan=app_lifespan)
-print("FastMCP server initialized", file=sys.stderr)
+logger.info("FastMCP server initialized")
+
+
+def _format_table(table_info: TableInfo) -> str:
+    """Format one table's schema, shared by every tool that shows tables"""
+    # Delegate formatting to the TableInfo model, which memoizes the text
+    return table_info.format_schema()
 
 
 @mcp.tool()
@@ -74,20 +100,19 @@ async def get_table_schema(table_name: str, ctx: Context) -> str:
     """Single-table columns + FK relationships (lazy loads & caches).
 
     Use: Inspect one table's structure before writing queries / building joins.
-    Compose: Pair with get_table_constraints + get_table_indexes for a full profile.
+    Compose: Pair with get_table_constraints + get_table_indexes, or use get_table_profile for all at once.
     Avoid: Looping across many tables for ranking (prefer get_related_tables + constraints/indexes directly).
 
     Args:
         table_name: Exact table name (case-insensitive).
     """
     db_context: DatabaseContext = ctx.request_context.lifespan_context
-    table_info = await db_context.get_schema_info(table_name)
+    table_info = await db_context.get_schema_info(canonical_name(table_name))
 
     if not table_info:
         return f"Table '{table_name}' not found in the schema."
 
-    # Delegate formatting to the TableInfo model
-    return table_info.format_schema()
+    return _format_table(table_info)
 
 
 @mcp.tool()
@@ -120,18 +145,23 @@ async def get_tables_schema(table_names: List[str], ctx: Context) -> str:
     Avoid: Broad discovery (use search_tables_schema first).
     """
     db_context: DatabaseContext = ctx.request_context.lifespan_context
-    results = []
 
-    for table_name in table_names:
-        table_info = await db_context.get_schema_info(table_name)
-        if not table_info:
-            results.append(f"\nTable '{table_name}' not found in the schema.")
-            continue
+    # Tables that aren't cached yet are loaded together in one batched query
+    table_infos = await db_context.get_schema_info_many(
+        [canonical_name(table_name) for table_name in table_names]
+    )
 
-        # Delegate formatting to the TableInfo model
-        results.append(table_info.format_schema())
+    def describe(table_name: str, table_info) -> str:
+        if isinstance(table_info, Exception):
+            return f"\nError loading table '{table_name}': {str(table_info)}"
+        if not table_info:
+            return f"\nTable '{table_name}' not found in the schema."
+        return _format_table(table_info)
 
-    return "\n".join(results)
+    return "\n".join(
+        describe(table_name, table_info)
+        for table_name, table_info in zip(table_names, table_infos)
+    )
 
 
 @mcp.tool()
@@ -145,47 +175,30 @@ async def search_tables_schema(search_term: str, ctx: Context) -> str:
     db_context: DatabaseContext = ctx.request_context.lifespan_context
 
     # Split search term by commas and whitespace and remove empty strings
-    search_terms = [term.strip() for term in search_term.replace(",", " ").split()]
-    search_terms = [term for term in search_terms if term]
+    search_terms = [term for term in _SEARCH_TERM_SPLIT_RE.split(search_term) if term]
 
     if not search_terms:
         return "No valid search terms provided"
 
-    # Track all matching tables without duplicates
-    matching_tables = set()
-
-    # Search for each term
-    for term in search_terms:
-        tables = await db_context.search_tables(term, limit=20)
-        matching_tables.update(tables)
-
-    # Convert back to list and limit to 20 results
-    matching_tables = list(matching_tables)
-    total_matches = len(matching_tables)
-    limited_tables = matching_tables[:20]
+    # Search all terms at once; the result has no duplicates and is already
+    # capped at 20 names, so later terms stop being searched once it is full
+    matching_tables = await db_context.search_tables_multi(search_terms, limit=20)
 
     if not matching_tables:
         return f"No tables found matching any of these terms: {', '.join(search_terms)}"
 
-    if total_matches > 20:
-        results = [
-            f"Found {total_matches} tables matching terms ({', '.join(search_terms)}). Returning the first 20 for performance reasons:"
-        ]
-    else:
-        results = [
-            f"Found {total_matches} tables matching terms ({', '.join(search_terms)}):"
-        ]
-
-    matching_tables = limited_tables
-
-    # Now load the schema for each matching table
-    for table_name in matching_tables:
-        table_info = await db_context.get_schema_info(table_name)
-        if not table_info:
-            continue
-
-        # Delegate formatting to the TableInfo model
-        results.append(table_info.format_schema())
+    results = [
+        f"Found {len(matching_tables)} tables matching terms ({', '.join(search_terms)}):"
+    ]
+
+    # Now load the schema for all matching tables; the uncached ones are
+    # fetched together in one batched query
+    table_infos = await db_context.get_schema_info_many(matching_tables)
+    results.extend(
+        _format_table(table_info)
+        for table_info in table_infos
+        if table_info and not isinstance(table_info, Exception)
+    )
 
     return "\n".join(results)
 
@@ -224,6 +237,40 @@ async def get_database_vendor_info(ctx: Context) -> str:
         return f"Error retrieving database vendor information: {str(e)}"
 
 
+def _iter_column_sections(
+    matching_columns: Iterable[Tuple[str, List[Column]]]
+) -> Iterator[str]:
+    """Yield one block of text per table listing its matching columns"""
+    for table_name, columns in matching_columns:
+        lines = [f"\nTable: {table_name}", "Matching columns:"]
+        lines.extend(
+            f"  - {col.name}: {col.type} {'NULL' if col.nullable else 'NOT NULL'}"
+            for col in columns
+        )
+        yield "\n".join(lines)
+
+
+# Optional PL/SQL object fields and their labels, in display order
+_OBJECT_DETAIL_FIELDS = (
+    ("owner", "Owner"),
+    ("status", "Status"),
+    ("created", "Created"),
+    ("last_modified", "Last Modified"),
+)
+
+
+def _iter_object_sections(objects: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield one block of text per PL/SQL object"""
+    for obj in objects:
+        lines = [f"\n{obj['type']}: {obj['name']}"]
+        lines.extend(
+            f"{label}: {obj[field]}"
+            for field, label in _OBJECT_DETAIL_FIELDS
+            if field in obj
+        )
+        yield "\n".join(lines)
+
+
 @mcp.tool()
 async def search_columns(search_term: str, ctx: Context) -> str:
     """Find columns (substring match) and list hosting tables (limit 50).
@@ -240,22 +287,24 @@ async def search_columns(search_term: str, ctx: Context) -> str:
         if not matching_columns:
             return f"No columns found matching '{search_term}'"
 
-        results = [
+        header = (
             f"Found columns matching '{search_term}' in {len(matching_columns)} tables:"
-        ]
-
-        for table_name, columns in matching_columns.items():
-            results.append(f"\nTable: {table_name}")
-            results.append("Matching columns:")
-            for col in columns:
-                nullable = "NULL" if col["nullable"] else "NOT NULL"
-                results.append(f"  - {col['name']}: {col['type']} {nullable}")
-
-        return "\n".join(results)
+        )
+        return "\n".join(
+            chain((header,), _iter_column_sections(matching_columns.items()))
+        )
     except Exception as e:
         return f"Error searching columns: {str(e)}"
 
 
+def _invalid_object_type(object_type: str) -> str:
+    """Message for an object type the PL/SQL tools don't support"""
+    return (
+        f"Invalid object_type '{object_type}'. "
+        f"Valid types: {', '.join(sorted(SUPPORTED_OBJECT_TYPES))}"
+    )
+
+
 @mcp.tool()
 async def get_pl_sql_objects(
     object_type: str, name_pattern: Optional[str], ctx: Context
@@ -268,27 +317,19 @@ async def get_pl_sql_objects(
     """
     db_context: DatabaseContext = ctx.request_context.lifespan_context
 
+    object_type = object_type.upper()
+    if object_type not in SUPPORTED_OBJECT_TYPES:
+        return _invalid_object_type(object_type)
+
     try:
-        objects = await db_context.get_pl_sql_objects(object_type.upper(), name_pattern)
+        objects = await db_context.get_pl_sql_objects(object_type, name_pattern)
 
         if not objects:
             pattern_msg = f" matching '{name_pattern}'" if name_pattern else ""
-            return f"No {object_type.upper()} objects found{pattern_msg}"
-
-        results = [f"Found {len(objects)} {object_type.upper()} objects:"]
+            return f"No {object_type} objects found{pattern_msg}"
 
-        for obj in objects:
-            results.append(f"\n{obj['type']}: {obj['name']}")
-            if "owner" in obj:
-                results.append(f"Owner: {obj['owner']}")
-            if "status" in obj:
-                results.append(f"Status: {obj['status']}")
-            if "created" in obj:
-                results.append(f"Created: {obj['created']}")
-            if "last_modified" in obj:
-                results.append(f"Last Modified: {obj['last_modified']}")
-
-        return "\n".join(results)
+        header = f"Found {len(objects)} {object_type} objects:"
+        return "\n".join(chain((header,), _iter_object_sections(objects)))
     except Exception as e:
         return f"Error retrieving PL/SQL objects: {str(e)}"
 
@@ -303,9 +344,12 @@ async def get_object_source(object_type: str, object_name: str, ctx: Context) ->
     """
     db_context: DatabaseContext = ctx.request_context.lifespan_context
 
+    if object_type.upper() not in SUPPORTED_OBJECT_TYPES:
+        return _invalid_object_type(object_type)
+
     try:
         source = await db_context.get_object_source(
-            object_type.upper(), object_name.upper()
+            object_type.upper(), canonical_name(object_name)
         )
 
         if not source:
@@ -316,6 +360,58 @@ async def get_object_source(object_type: str, object_name: str, ctx: Context) ->
         return wrap_untrusted(f"Error retrieving object source: {str(e)}")
 
 
+@mcp.tool()
+async def get_objects_source(
+    object_type: str, object_names: List[str], ctx: Context
+) -> str:
+    """Batch version of get_object_source for several objects of one type.
+
+    Use: Reviewing a short list of related objects (e.g. a package family).
+    Compose: Names typically come from get_pl_sql_objects or get_dependent_objects.
+    Avoid: Dumping a whole schema (fetch only what you need).
+    """
+    db_context: DatabaseContext = ctx.request_context.lifespan_context
+
+    object_type = object_type.upper()
+    if object_type not in SUPPORTED_OBJECT_TYPES:
+        return _invalid_object_type(object_type)
+
+    try:
+        sources = await db_context.get_objects_source(object_type, object_names)
+
+        def describe(object_name: str, source: str) -> str:
+            if not source:
+                return f"No source found for {object_type} {object_name}"
+            return f"Source for {object_type} {object_name}:\n\n{source}"
+
+        return wrap_untrusted(
+            "\n\n".join(describe(name, source) for name, source in sources.items())
+        )
+    except Exception as e:
+        return wrap_untrusted(f"Error retrieving object sources: {str(e)}")
+
+
+def _format_constraints(table_name: str, constraints: List[Constraint]) -> str:
+    """Format a table's constraints, shared by the constraints and profile tools"""
+    if not constraints:
+        return f"No constraints found for table '{table_name}'"
+
+    results = [f"Constraints for table '{table_name}':"]
+
+    for constraint in constraints:
+        results.append(f"\n{constraint.type} Constraint: {constraint.name}")
+        results.append(f"Columns: {', '.join(constraint.columns)}")
+
+        ref = constraint.references
+        if ref is not None and constraint.type == "FOREIGN KEY":
+            results.append(f"References: {ref.table}({', '.join(ref.columns)})")
+
+        if constraint.condition is not None:
+            results.append(f"Condition: {constraint.condition}")
+
+    return "\n".join(results)
+
+
 @mcp.tool()
 async def get_table_constraints(table_name: str, ctx: Context) -> str:
     """List PK / FK / UNIQUE / CHECK constraints for one table (cached TTL).
@@ -327,34 +423,31 @@ async def get_table_constraints(table_name: str, ctx: Context) -> str:
     db_context: DatabaseContext = ctx.request_context.lifespan_context
 
     try:
-        constraints = await db_context.get_table_constraints(table_name)
+        constraints = await db_context.get_table_constraints(canonical_name(table_name))
+        return _format_constraints(table_name, constraints)
+    except Exception as e:
+        return f"Error retrieving constraints: {str(e)}"
 
-        if not constraints:
-            return f"No constraints found for table '{table_name}'"
 
-        results = [f"Constraints for table '{table_name}':"]
+def _format_indexes(table_name: str, indexes: List[Index]) -> str:
+    """Format a table's indexes, shared by the indexes and profile tools"""
+    if not indexes:
+        return f"No indexes found for table '{table_name}'"
 
-        for constraint in constraints:
-            constraint_type = constraint.get("type", "UNKNOWN")
-            name = constraint.get("name", "UNNAMED")
+    results = [f"Indexes for table '{table_name}':"]
 
-            results.append(f"\n{constraint_type} Constraint: {name}")
+    for idx in indexes:
+        idx_type = "UNIQUE " if idx.unique else ""
+        results.append(f"\n{idx_type}Index: {idx.name}")
+        results.append(f"Columns: {', '.join(idx.columns)}")
 
-            if "columns" in constraint:
-                results.append(f"Columns: {', '.join(constraint['columns'])}")
+        if idx.tablespace is not None:
+            results.append(f"Tablespace: {idx.tablespace}")
 
-            if constraint_type == "FOREIGN KEY" and "references" in constraint:
-                ref = constraint["references"]
-                results.append(
-                    f"References: {ref['table']}({', '.join(ref['columns'])})"
-                )
-
-            if "condition" in constraint:
-                results.append(f"Condition: {constraint['condition']}")
+        if idx.status is not None:
+            results.append(f"Status: {idx.status}")
 
-        return "\n".join(results)
-    except Exception as e:
-        return f"Error retrieving constraints: {str(e)}"
+    return "\n".join(results)
 
 
 @mcp.tool()
@@ -368,41 +461,33 @@ async def get_table_indexes(table_name: str, ctx: Context) -> str:
     db_context: DatabaseContext = ctx.request_context.lifespan_context
 
     try:
-        indexes = await db_context.get_table_indexes(table_name)
-
-        if not indexes:
-            return f"No indexes found for table '{table_name}'"
-
-        results = [f"Indexes for table '{table_name}':"]
-
-        for idx in indexes:
-            idx_type = "UNIQUE " if idx.get("unique", False) else ""
-            results.append(f"\n{idx_type}Index: {idx['name']}")
-            results.append(f"Columns: {', '.join(idx['columns'])}")
-
-            if "tablespace" in idx:
-                results.append(f"Tablespace: {idx['tablespace']}")
-
-            if "status" in idx:
-                results.append(f"Status: {idx['status']}")
-
-        return "\n".join(results)
+        indexes = await db_context.get_table_indexes(canonical_name(table_name))
+        return _format_indexes(table_name, indexes)
     except Exception as e:
         return f"Error retrieving indexes: {str(e)}"
 
 
 @mcp.tool()
-async def get_dependent_objects(object_name: str, ctx: Context) -> str:
+async def get_dependent_objects(
+    object_name: str, ctx: Context, include_columns: bool = False
+) -> str:
     """List objects (views / PL/SQL / triggers) depending on a table/object.
 
     Use: Impact analysis & centrality (importance scoring dimension).
     Compose: Combine counts with FK + index metrics for ranking.
     Avoid: Running on every table blindly—filter candidates first.
+
+    With include_columns, the columns of dependent views and tables are
+    fetched in the same query and listed under each dependent.
     """
     db_context: DatabaseContext = ctx.request_context.lifespan_context
 
     try:
-        dependencies = await db_context.get_dependent_objects(object_name.upper())
+        key = canonical_name(object_name)
+        if include_columns:
+            dependencies = await db_context.get_dependents_with_details(key)
+        else:
+            dependencies = await db_context.get_dependent_objects(key)
 
         if not dependencies:
             return f"No objects found that depend on '{object_name}'"
@@ -413,6 +498,11 @@ async def get_dependent_objects(object_name: str, ctx: Context) -> str:
             results.append(f"\n{dep['type']}: {dep['name']}")
             if "owner" in dep:
                 results.append(f"Owner: {dep['owner']}")
+            for column in dep.get("columns", ()):
+                results.append(
+                    f"  - {column['name']}: {column['type']} "
+                    f"{'NULL' if column['nullable'] else 'NOT NULL'}"
+                )
 
         return "\n".join(results)
     except Exception as e:
@@ -453,6 +543,28 @@ async def get_user_defined_types(type_pattern: Optional[str], ctx: Context) -> s
         return f"Error retrieving user-defined types: {str(e)}"
 
 
+def _format_related_tables(table_name: str, related: Dict[str, List[str]]) -> str:
+    """Format a table's FK neighbours, shared by the related tables and profile tools"""
+    if not related["referenced_tables"] and not related["referencing_tables"]:
+        return f"No related tables found for '{table_name}'"
+
+    results = [f"Tables related to '{table_name}':"]
+
+    if related["referenced_tables"]:
+        results.append("\nTables referenced by this table (outgoing foreign keys):")
+        for table in related["referenced_tables"]:
+            results.append(f"  - {table}")
+
+    if related["referencing_tables"]:
+        results.append(
+            "\nTables that reference this table (incoming foreign keys):"
+        )
+        for table in related["referencing_tables"]:
+            results.append(f"  - {table}")
+
+    return "\n".join(results)
+
+
 @mcp.tool()
 async def get_related_tables(table_name: str, ctx: Context) -> str:
     """FK in/out adjacency for one table (incoming + outgoing lists, cached TTL).
@@ -464,29 +576,50 @@ async def get_related_tables(table_name: str, ctx: Context) -> str:
     db_context: DatabaseContext = ctx.request_context.lifespan_context
 
     try:
-        related = await db_context.get_related_tables(table_name)
+        related = await db_context.get_related_tables(canonical_name(table_name))
+        return _format_related_tables(table_name, related)
+    except Exception as e:
+        return f"Error getting related tables: {str(e)}"
 
-        if not related["referenced_tables"] and not related["referencing_tables"]:
-            return f"No related tables found for '{table_name}'"
 
-        results = [f"Tables related to '{table_name}':"]
+@mcp.tool()
+async def get_table_profile(table_name: str, ctx: Context) -> str:
+    """One-call table profile: schema, constraints, indexes and FK neighbours.
 
-        if related["referenced_tables"]:
-            results.append("\nTables referenced by this table (outgoing foreign keys):")
-            for table in related["referenced_tables"]:
-                results.append(f"  - {table}")
+    Use: Full structural picture of a table before query design or ranking.
+    Compose: Replaces get_table_schema + get_table_constraints + get_table_indexes + get_related_tables for one table.
+    Avoid: Calling per table across a large candidate set (filter first).
 
-        if related["referencing_tables"]:
-            results.append(
-                "\nTables that reference this table (incoming foreign keys):"
-            )
-            for table in related["referencing_tables"]:
-                results.append(f"  - {table}")
+    The four lookups run concurrently, each on its own pooled connection; a
+    failed lookup is reported in its section without hiding the others.
+    """
+    db_context: DatabaseContext = ctx.request_context.lifespan_context
+    key = canonical_name(table_name)
+
+    table_info, constraints, indexes, related = await asyncio.gather(
+        db_context.get_schema_info(key),
+        db_context.get_table_constraints(key),
+        db_context.get_table_indexes(key),
+        db_context.get_related_tables(key),
+        return_exceptions=True,
+    )
 
-        return "\n".join(results)
+    if isinstance(table_info, BaseException):
+        return f"Error retrieving table schema: {str(table_info)}"
+    if not table_info:
+        return f"Table '{table_name}' not found in the schema."
 
-    except Exception as e:
-        return f"Error getting related tables: {str(e)}"
+    sections = [_format_table(table_info)]
+    for result, format_section, error in (
+        (constraints, _format_constraints, "Error retrieving constraints"),
+        (indexes, _format_indexes, "Error retrieving indexes"),
+        (related, _format_related_tables, "Error getting related tables"),
+    ):
+        if isinstance(result, BaseException):
+            sections.append(f"{error}: {str(result)}")
+        else:
+            sections.append(format_section(table_name, result))
+    return "\n\n".join(sections)
 
 
 @mcp.tool()
@@ -18,16 +18,20 @@ def oracle_connection_string():
         pytest.skip(f"Environment variable {ORACLE_CONN_ENV} not set; integration tests skipped.")
     return DEFAULT_CONN
 
-@pytest_asyncio.fixture(scope="function")
-async def db_context_read_only(oracle_connection_string, tmp_path_factory):
-    """Function-scoped to ensure all asyncio primitives (locks, pool) are bound
-    to the same event loop as the awaiting test. Session scope previously caused
-    'Future attached to a different loop' when pytest-asyncio created a new loop
-    per test while reusing the same DatabaseContext instance."""
-    cache_dir = tmp_path_factory.mktemp("cache")
+@pytest.fixture(scope="session")
+def schema_cache_dir(tmp_path_factory):
+    """Cache directory shared by both contexts, so the schema is scanned once"""
+    return tmp_path_factory.mktemp("cache")
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_context_read_only(oracle_connection_string, schema_cache_dir):
+    """Session-scoped so the schema cache is built (and the pool opened) once
+    for the whole run. The fixture and every test run on the one session event
+    loop (asyncio_default_test_loop_scope in pytest.ini), so the context's
+    locks and pool stay bound to the loop awaiting them."""
     ctx = DatabaseContext(
         connection_string=oracle_connection_string,
-        cache_path=Path(cache_dir / "schema_cache.json"),
+        cache_path=Path(schema_cache_dir / "schema_cache.json"),
         read_only=True,
         target_schema=os.getenv("TARGET_SCHEMA") or None,
     )
@@ -37,13 +41,18 @@ async def db_context_read_only(oracle_connection_string, tmp_path_factory):
     finally:
         await ctx.close()
 
-@pytest_asyncio.fixture(scope="function")
-async def db_context_write_enabled(oracle_connection_string, tmp_path_factory):
-    """Function-scoped variant for write-enabled context for same loop-safety reasons."""
-    cache_dir = tmp_path_factory.mktemp("cache_write")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_context_write_enabled(
+    oracle_connection_string, schema_cache_dir, db_context_read_only
+):
+    """Session-scoped write-enabled variant, sharing the session event loop.
+
+    Depends on the read-only context so the schema cache it built is already
+    on disk; this context only opens it instead of scanning the schema again.
+    """
     ctx = DatabaseContext(
         connection_string=oracle_connection_string,
-        cache_path=Path(cache_dir / "schema_cache.json"),
+        cache_path=Path(schema_cache_dir / "schema_cache.json"),
         read_only=False,
         target_schema=os.getenv("TARGET_SCHEMA") or None,
     )
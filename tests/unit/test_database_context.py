@@ -0,0 +1,48 @@
+import asyncio
+from pathlib import Path
+
+from db_context import DatabaseContext
+
+
+async def test_concurrent_cache_misses_share_one_fetch(tmp_path: Path):
+    context = DatabaseContext("user/password@localhost/XEPDB1", tmp_path / "schema_cache.json")
+    fetches = []
+
+    async def get_table_constraints(table_name):
+        fetches.append(table_name)
+        await asyncio.sleep(0)
+        return [{"name": "PK_ORDERS", "type": "PRIMARY KEY"}]
+
+    context.db_connector.get_table_constraints = get_table_constraints
+
+    results = await asyncio.gather(
+        *(context.get_table_constraints("ORDERS") for _ in range(5))
+    )
+    assert fetches == ["ORDERS"]
+    assert all(result == results[0] for result in results)
+    assert context.schema_manager.cache_stats["misses"] == 1
+    assert not context._inflight
+
+    # Later calls are answered from the object cache
+    await context.get_table_constraints("ORDERS")
+    assert fetches == ["ORDERS"]
+
+
+async def test_database_info_is_fetched_once(tmp_path: Path):
+    context = DatabaseContext("user/password@localhost/XEPDB1", tmp_path / "schema_cache.json")
+    fetches = []
+
+    async def fetch_database_info():
+        fetches.append(1)
+        await asyncio.sleep(0)
+        info = {"vendor": "Oracle", "version": "Oracle Database 19c"}
+        context.db_connector._database_info = info
+        return info
+
+    context.db_connector._fetch_database_info = fetch_database_info
+
+    results = await asyncio.gather(*(context.get_database_info() for _ in range(3)))
+    assert fetches == [1]
+    assert all(result is results[0] for result in results)
+    await context.get_database_info()
+    assert fetches == [1]
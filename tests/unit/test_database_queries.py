@@ -0,0 +1,157 @@
+from db_context.database import BULK_DETAILS_MIN_TABLES, DatabaseConnector
+
+
+class FakeCursor:
+    """Async cursor stand-in answering each execute with the next queued result."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.arraysize = 100
+        self.prefetchrows = 2
+
+    async def execute(self, sql, **params):
+        self.connection.executed.append((" ".join(sql.split()), params))
+        self._rows = self.connection.results.pop(0)
+
+    async def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    username = "testuser"
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+def make_connector(connection):
+    connector = DatabaseConnector("user/password@localhost/XEPDB1")
+
+    async def get_connection():
+        return connection
+
+    async def close_connection(conn):
+        pass
+
+    async def string_collection(conn, values):
+        return list(values)
+
+    connector.get_connection = get_connection
+    connector._close_connection = close_connection
+    connector._string_collection = string_collection
+    return connector
+
+
+async def test_objects_source_reads_packages_in_one_query():
+    connection = FakeConnection(
+        [[("PKG_A", "PACKAGE pkg_a AS\n"), ("PKG_A", "END;\n"), ("PKG_B", "PACKAGE pkg_b AS\n")]]
+    )
+    connector = make_connector(connection)
+
+    sources = await connector.get_objects_source("PACKAGE", ["pkg_a", "PKG_B", "PKG_A", "missing"])
+    assert sources == {
+        "PKG_A": "PACKAGE pkg_a AS\nEND;\n",
+        "PKG_B": "PACKAGE pkg_b AS\n",
+        "MISSING": "",
+    }
+    [(sql, params)] = connection.executed
+    assert "FROM all_source" in sql
+    assert params == {
+        "owner": "TESTUSER",
+        "type": "PACKAGE",
+        "names": ["PKG_A", "PKG_B", "MISSING"],
+    }
+
+
+async def test_objects_source_uses_ddl_for_procedures():
+    connector = make_connector(FakeConnection([]))
+    calls = []
+
+    async def get_object_source(object_type, object_name):
+        calls.append((object_type, object_name))
+        return f"CREATE OR REPLACE {object_type} {object_name}"
+
+    connector.get_object_source = get_object_source
+
+    sources = await connector.get_objects_source("PROCEDURE", ["proc_a", "PROC_B"])
+    assert sources == {
+        "PROC_A": "CREATE OR REPLACE PROCEDURE PROC_A",
+        "PROC_B": "CREATE OR REPLACE PROCEDURE PROC_B",
+    }
+    assert calls == [("PROCEDURE", "PROC_A"), ("PROCEDURE", "PROC_B")]
+
+
+async def test_many_table_details_switches_to_bulk_query_by_count():
+    connector = make_connector(FakeConnection([]))
+    single_loads = []
+    bulk_loads = []
+
+    async def load_table_details(table_name):
+        single_loads.append(table_name)
+        return None if table_name == "MISSING" else {"columns": [], "relationships": {}}
+
+    async def load_tables_details(names):
+        bulk_loads.append(names)
+        return {name: {"columns": [], "relationships": {}} for name in names}
+
+    connector.load_table_details = load_table_details
+    connector.load_tables_details = load_tables_details
+
+    details = await connector.load_many_table_details(["orders", "MISSING", "ORDERS"])
+    assert list(details) == ["ORDERS"]
+    assert single_loads == ["ORDERS", "MISSING"]
+    assert bulk_loads == []
+
+    names = [f"T{i}" for i in range(BULK_DETAILS_MIN_TABLES)]
+    details = await connector.load_many_table_details(names)
+    assert list(details) == names
+    assert bulk_loads == [names]
+    assert single_loads == ["ORDERS", "MISSING"]
+
+
+async def test_dependents_with_details_groups_columns_per_dependent():
+    connection = FakeConnection(
+        [
+            [
+                ("ORDERS_TRG", "TRIGGER", "TESTUSER", None, None, None),
+                ("ORDERS_V", "VIEW", "TESTUSER", "ID", "NUMBER(10)", "N"),
+                ("ORDERS_V", "VIEW", "TESTUSER", "NOTE", "VARCHAR2(100)", "Y"),
+            ]
+        ]
+    )
+    connector = make_connector(connection)
+
+    dependents = await connector.get_dependents_with_details("ORDERS")
+    assert dependents == [
+        {"name": "ORDERS_TRG", "type": "TRIGGER", "owner": "TESTUSER", "columns": []},
+        {
+            "name": "ORDERS_V",
+            "type": "VIEW",
+            "owner": "TESTUSER",
+            "columns": [
+                {"name": "ID", "type": "NUMBER(10)", "nullable": False},
+                {"name": "NOTE", "type": "VARCHAR2(100)", "nullable": True},
+            ],
+        },
+    ]
+    # Dependents and their columns come from one query
+    [(sql, params)] = connection.executed
+    assert "FROM all_dependencies" in sql
+    assert "LEFT JOIN all_tab_columns" in sql
+    assert params == {"object_name": "ORDERS", "owner": "TESTUSER"}
+
+
+async def test_column_search_escapes_like_wildcards():
+    connection = FakeConnection([[("CUSTOMERS", "CUST_ID", "NUMBER(10)", "N")]])
+    connector = make_connector(connection)
+
+    result = await connector.search_columns_in_database("cust_id%", limit=5)
+    assert list(result) == ["CUSTOMERS"]
+    # "_" and "%" match only themselves, as in the cached column index
+    [(sql, params)] = connection.executed
+    assert "ESCAPE '\\'" in sql
+    assert params["search_term"] == "CUST\\_ID\\%"
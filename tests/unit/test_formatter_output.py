@@ -45,3 +45,13 @@ def test_format_sql_query_result_truncation_and_note():
     assert lines[1].startswith("| ---")
     assert "…" in lines[2], "Truncated ellipsis missing in data row"
     assert any(line.startswith("Note: Some values truncated") for line in lines[3:]), "Truncation note missing"
+
+
+def test_format_sql_query_result_null_cells_are_empty():
+    """NULL values (None) render as empty, padded cells."""
+    result = {
+        "columns": ["ID", "NAME"],
+        "rows": [{"ID": 1, "NAME": None}],
+    }
+    table = format_sql_query_result(result)
+    assert table.splitlines()[2] == "| 1  |      |"
@@ -0,0 +1,53 @@
+import pytest
+
+from db_context.models import Column, TableInfo
+from db_context.schema.name_index import ColumnNameIndex, TableNameIndex
+
+NAMES = ["CUSTOMERS", "CUSTOMER_ORDERS", "ORDERS", "ORDER_ITEMS", "HIST_ORDERS", "XY"]
+
+
+@pytest.mark.parametrize("term", ["ORDER", "CUST", "ITEMS", "XY", "S", "HIST_ORDERS", "NOPE", "RS_"])
+def test_search_matches_linear_scan(term):
+    index = TableNameIndex(NAMES)
+    expected = sorted(name for name in NAMES if term in name)
+    assert index.search(term) == expected
+
+
+def test_search_stops_at_limit():
+    index = TableNameIndex(NAMES)
+    assert index.search("ORDER", limit=2) == ["CUSTOMER_ORDERS", "HIST_ORDERS"]
+    assert index.search("O", limit=1) == ["CUSTOMERS"]
+    assert index.search("ORDER", limit=0) == []
+
+
+def test_column_index_searches_loaded_tables_only():
+    tables = {
+        "ORDERS": TableInfo("ORDERS", [Column("ORDER_ID", "NUMBER", False), Column("CUSTOMER_ID", "NUMBER", True)], {}, True),
+        "CUSTOMERS": TableInfo("CUSTOMERS", [Column("CUSTOMER_ID", "NUMBER", False)], {}, True),
+        "ITEMS": TableInfo("ITEMS", [], {}, False),
+    }
+    index = ColumnNameIndex(tables)
+    assert index.search("CUSTOMER") == {
+        "ORDERS": [Column("CUSTOMER_ID", "NUMBER", True)],
+        "CUSTOMERS": [Column("CUSTOMER_ID", "NUMBER", False)],
+    }
+    assert index.search("ID").keys() == {"ORDERS", "CUSTOMERS"}
+    assert index.search("NOPE") == {}
+
+
+def test_column_index_keeps_each_tables_column_order():
+    x_id, y_id = Column("X_ID", "NUMBER", True), Column("Y_ID", "NUMBER", True)
+    tables = {
+        "A": TableInfo("A", [x_id, y_id], {}, True),
+        "B": TableInfo("B", [y_id, x_id], {}, True),
+    }
+    index = ColumnNameIndex(tables)
+    assert index.search("_ID") == {"A": [x_id, y_id], "B": [y_id, x_id]}
+
+
+def test_column_index_matches_underscore_literally():
+    tables = {
+        "CUSTOMERS": TableInfo("CUSTOMERS", [Column("CUSTXID", "NUMBER", False), Column("CUST_ID", "NUMBER", False)], {}, True),
+    }
+    index = ColumnNameIndex(tables)
+    assert index.search("CUST_ID") == {"CUSTOMERS": [Column("CUST_ID", "NUMBER", False)]}
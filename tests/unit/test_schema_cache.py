@@ -0,0 +1,475 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+from db_context.models import Column, Constraint, ConstraintReference, Index, TableInfo
+from db_context.schema.manager import SchemaManager
+
+
+class FakeConnector:
+    """Minimal stand-in for DatabaseConnector used by SchemaManager."""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.detail_loads = []
+        self.batch_loads = []
+        self.ddl_times = dict.fromkeys(tables, 1.0)
+
+    async def get_effective_schema(self):
+        return "TESTUSER"
+
+    async def warm_schema(self):
+        objects = [{"name": "P1", "type": "PROCEDURE", "status": "VALID", "owner": "TESTUSER"}]
+        return set(self.tables), objects
+
+    async def get_table_ddl_times(self):
+        return dict(self.ddl_times)
+
+    async def load_table_details(self, table_name):
+        self.detail_loads.append(table_name)
+        if table_name not in self.tables:
+            return None
+        return {"columns": self.tables[table_name], "relationships": {}}
+
+    async def get_largest_table_names(self, limit):
+        return sorted(self.tables)[:limit]
+
+    async def load_tables_details(self, names):
+        self.batch_loads.append(list(names))
+        self.detail_loads.extend(names)
+        return {
+            name: {"columns": self.tables[name], "relationships": {}}
+            for name in names
+            if name in self.tables
+        }
+
+    async def load_many_table_details(self, names, concurrency=8):
+        return await self.load_tables_details(names)
+
+
+TABLES = {
+    "CUSTOMERS": [{"name": "ID", "type": "NUMBER", "nullable": False}],
+    "ORDERS": [{"name": "CUSTOMER_ID", "type": "NUMBER", "nullable": True}],
+}
+
+
+async def test_cache_round_trip(tmp_path: Path):
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await manager.initialize()
+    assert manager.cache.all_table_names == set(TABLES)
+    assert manager.get_cached("plsql", "PROCEDURE_all") is not None
+
+    info = await manager.get_schema_info("customers")
+    assert info.fully_loaded
+    assert info.columns == [Column("ID", "NUMBER", False)]
+    assert "ID: NUMBER NOT NULL" in info.format_schema()
+    assert info.format_schema() is info.format_schema()
+    await manager.save_cache()
+
+    reloaded = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    cached = await reloaded.get_schema_info("CUSTOMERS")
+    assert cached.fully_loaded
+    assert cached.columns == [Column("ID", "NUMBER", False)]
+    assert reloaded.db_connector.detail_loads == []
+    await manager.close()
+    await reloaded.close()
+
+
+async def test_unknown_table_returns_none(tmp_path: Path):
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await manager.initialize()
+    assert await manager.get_schema_info("MISSING") is None
+    await manager.close()
+
+
+async def test_lazy_loads_write_only_their_row(tmp_path: Path):
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await manager.initialize()
+    assert manager.cache_path.suffix == ".db"
+    await manager.get_schema_info("ORDERS")
+
+    with sqlite3.connect(manager.cache_path) as db:
+        assert db.execute("SELECT name FROM tables").fetchall() == [("ORDERS",)]
+
+    reloaded = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    info = await reloaded.get_schema_info("ORDERS")
+    assert info.fully_loaded
+    assert reloaded.db_connector.detail_loads == []
+    await manager.close()
+    await reloaded.close()
+
+
+def test_table_rows_store_columns_positionally():
+    info = TableInfo.from_dict(
+        "ORDERS",
+        {
+            "columns": [{"name": "ID", "type": "NUMBER", "nullable": False}],
+            "relationships": {},
+        },
+    )
+    data = info.to_dict()
+    assert data["columns"] == [["ID", "NUMBER", False]]
+    assert TableInfo.from_dict("ORDERS", data).columns == info.columns
+
+
+async def test_unreadable_cache_is_rebuilt(tmp_path: Path):
+    (tmp_path / "testuser.db").write_bytes(b"not a database")
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await manager.initialize()
+    assert manager.cache.all_table_names == set(TABLES)
+    await manager.close()
+
+
+def test_object_cache_expires_and_is_bounded(tmp_path: Path, monkeypatch):
+    import db_context.schema.manager as manager_module
+
+    monkeypatch.setattr(manager_module, "OBJECT_CACHE_MAX_ENTRIES", 2)
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    for key in ("A", "B", "C"):
+        manager.update_cache("indexes", key, [key])
+    assert list(manager.object_cache["indexes"]) == ["B", "C"]
+    assert manager.get_cached("indexes", "C") == ["C"]
+
+    # A read keeps an entry from being the next one evicted
+    assert manager.get_cached("indexes", "B") == ["B"]
+    manager.update_cache("indexes", "D", ["D"])
+    assert list(manager.object_cache["indexes"]) == ["B", "D"]
+
+    manager.object_cache["indexes"]["B"]["timestamp"] -= manager.ttl["indexes"]
+    assert manager.get_cached("indexes", "B") is None
+    assert "B" not in manager.object_cache["indexes"]
+
+
+async def test_ddl_change_invalidates_only_changed_tables(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    await manager.get_schema_info("CUSTOMERS")
+    await manager.get_schema_info("ORDERS")
+    await manager.close()
+
+    connector.ddl_times["ORDERS"] = 2.0
+    connector.detail_loads.clear()
+    reloaded = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    # Stored rows are only read when their table is requested, and the DDL
+    # check runs in the background
+    assert reloaded.cache.tables == {}
+    await reloaded._ddl_check_task
+
+    assert (await reloaded.get_schema_info("CUSTOMERS")).fully_loaded
+    assert connector.detail_loads == []
+    info = await reloaded.get_schema_info("ORDERS")
+    assert info.ddl_time == 2.0
+    assert connector.detail_loads == ["ORDERS"]
+    await reloaded.get_schema_info("CUSTOMERS")
+    assert connector.detail_loads == ["ORDERS"]
+    await reloaded.close()
+
+
+async def test_rows_of_dropped_tables_are_removed(tmp_path: Path):
+    connector = FakeConnector(dict(TABLES))
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    await manager.get_schema_info("ORDERS")
+    await manager.close()
+
+    del connector.tables["ORDERS"], connector.ddl_times["ORDERS"]
+    reloaded = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    await reloaded._ddl_check_task
+    assert "ORDERS" not in reloaded.cache.all_table_names
+    with sqlite3.connect(reloaded.cache_path) as db:
+        assert db.execute("SELECT name FROM tables").fetchall() == []
+    await reloaded.close()
+
+
+async def test_stored_cache_is_served_before_ddl_check(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    await manager.get_schema_info("ORDERS")
+    await manager.close()
+
+    connector.ddl_times["ORDERS"] = 2.0
+    connector.detail_loads.clear()
+    checked = asyncio.Event()
+    get_table_ddl_times = connector.get_table_ddl_times
+
+    async def slow_ddl_times():
+        await checked.wait()
+        return await get_table_ddl_times()
+
+    connector.get_table_ddl_times = slow_ddl_times
+    reloaded = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    assert (await reloaded.get_schema_info("ORDERS")).ddl_time == 1.0
+
+    # The check then refreshes the stale table in the background
+    checked.set()
+    await reloaded._ddl_check_task
+    await asyncio.gather(*reloaded._load_tasks.values())
+    assert (await reloaded.get_schema_info("ORDERS")).ddl_time == 2.0
+    assert connector.detail_loads == ["ORDERS"]
+    await reloaded.close()
+
+
+async def test_concurrent_loads_share_one_query(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    first, second = await asyncio.gather(
+        manager.get_schema_info("CUSTOMERS"), manager.get_schema_info("customers")
+    )
+    assert first is second
+    assert connector.detail_loads == ["CUSTOMERS"]
+    await manager.close()
+
+
+async def test_ddl_change_refreshes_live_cache_in_background(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    stale = await manager.get_schema_info("ORDERS")
+
+    connector.ddl_times["ORDERS"] = 2.0
+    assert await manager.check_schema_changes() == 1
+    # The stale entry is still served while the refresh runs
+    assert manager.cache.tables["ORDERS"] is stale
+    await asyncio.gather(*manager._load_tasks.values())
+    assert manager.cache.tables["ORDERS"].ddl_time == 2.0
+    await manager.close()
+
+
+async def test_prefetch_loads_tables_once(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    assert await manager.prefetch(["orders", "CUSTOMERS", "MISSING", "ORDERS"]) == 2
+    assert connector.batch_loads == [["ORDERS", "CUSTOMERS"]]
+    assert await manager.prefetch(["ORDERS"]) == 0
+    await manager.close()
+
+
+async def test_get_schema_info_many_loads_missing_tables_in_one_batch(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+
+    infos = await manager.get_schema_info_many(["orders", "MISSING", "CUSTOMERS", "ORDERS"])
+    assert [info and info.table_name for info in infos] == ["ORDERS", None, "CUSTOMERS", "ORDERS"]
+    assert connector.batch_loads == [["ORDERS", "CUSTOMERS"]]
+    assert all(manager.cache.tables[name].fully_loaded for name in TABLES)
+
+    # Cached tables don't start another batch
+    await manager.get_schema_info_many(["ORDERS", "CUSTOMERS"])
+    assert len(connector.batch_loads) == 1
+    await manager.close()
+
+
+async def test_prewarm_loads_largest_tables_in_one_batch(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    await manager.get_schema_info("CUSTOMERS")
+    connector.detail_loads.clear()
+    assert await manager.prewarm() == 1
+    assert connector.detail_loads == ["ORDERS"]
+    assert await manager.prewarm() == 0
+    await manager.close()
+
+    reloaded = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    assert (await reloaded.get_schema_info("ORDERS")).fully_loaded
+    assert reloaded.db_connector.detail_loads == []
+    await reloaded.close()
+
+
+async def test_recent_tables_are_prefetched_after_ddl_change(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    await manager.get_schema_info("ORDERS")
+    await manager.close()
+
+    connector.ddl_times["ORDERS"] = 2.0
+    connector.detail_loads.clear()
+    reloaded = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    await reloaded._prefetch_task
+    assert connector.detail_loads == ["ORDERS"]
+    assert reloaded.cache.tables["ORDERS"].fully_loaded
+    await reloaded.close()
+
+
+async def test_rebuild_reloads_recent_tables(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    await manager.get_schema_info("ORDERS")
+    connector.detail_loads.clear()
+
+    cache = await manager.rebuild_cache()
+    assert not cache.tables["ORDERS"].fully_loaded
+    await manager._prefetch_task
+    assert connector.detail_loads == ["ORDERS"]
+    assert manager.cache.tables["ORDERS"].fully_loaded
+    await manager.close()
+
+
+async def test_rebuild_drops_object_caches(tmp_path: Path):
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await manager.initialize()
+    manager.update_cache("constraints", "ORDERS", [])
+    await manager.save_cache()
+
+    await manager.rebuild_cache()
+    assert manager.get_cached("constraints", "ORDERS") is None
+    # The PL/SQL listings are warmed again by the rebuild
+    assert manager.get_cached("plsql", manager.plsql_cache_key("PROCEDURE"))
+    await manager.close()
+
+    reloaded = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    assert reloaded.get_cached("constraints", "ORDERS") is None
+    await reloaded.close()
+
+
+async def test_concurrent_first_access_builds_cache_once(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    warm_calls = []
+    warm_schema = connector.warm_schema
+
+    async def counting_warm_schema():
+        warm_calls.append(1)
+        return await warm_schema()
+
+    connector.warm_schema = counting_warm_schema
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await asyncio.gather(
+        manager.get_schema_info("ORDERS"),
+        manager.search_columns("ID"),
+        manager.prefetch(["CUSTOMERS"]),
+    )
+    assert len(warm_calls) == 1
+    await manager.close()
+
+
+async def test_object_cache_saves_only_changed_entries(tmp_path: Path):
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await manager.initialize()
+    manager.update_cache("indexes", "ORDERS", [Index("ORDERS_PK", True, ["ID"])])
+    await manager.save_cache()
+
+    with sqlite3.connect(manager.cache_path) as db:
+        db.execute("UPDATE objects SET entry = CAST('{}' AS BLOB) WHERE key = 'PROCEDURE_all'")
+    manager.update_cache("indexes", "CUSTOMERS", [])
+    await manager.save_cache()
+    with sqlite3.connect(manager.cache_path) as db:
+        # The untouched entry was not rewritten
+        assert db.execute("SELECT entry FROM objects WHERE key = 'PROCEDURE_all'").fetchone() == (b"{}",)
+        assert db.execute("SELECT COUNT(*) FROM objects WHERE cache_type = 'indexes'").fetchone() == (2,)
+    await manager.close()
+
+    reloaded = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    # A reloaded cache is ordered by write time; the read then makes ORDERS
+    # the most recently used
+    assert list(reloaded.object_cache["indexes"]) == ["ORDERS", "CUSTOMERS"]
+    assert reloaded.get_cached("indexes", "ORDERS") == [Index("ORDERS_PK", True, ["ID"])]
+    assert list(reloaded.object_cache["indexes"]) == ["CUSTOMERS", "ORDERS"]
+    await reloaded.close()
+
+
+async def test_constraints_round_trip_as_models(tmp_path: Path):
+    constraints = [
+        Constraint("ORDERS_FK", "FOREIGN KEY", ["CUSTOMER_ID"], ConstraintReference("CUSTOMERS", ["ID"])),
+        Constraint("ORDERS_CK", "CHECK", ["CUSTOMER_ID"], condition="CUSTOMER_ID > 0"),
+    ]
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await manager.initialize()
+    manager.update_cache("constraints", "ORDERS", constraints)
+    await manager.close()
+
+    reloaded = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    assert reloaded.get_cached("constraints", "ORDERS") == constraints
+    await reloaded.close()
+
+
+async def test_search_tables_multi_merges_terms(tmp_path: Path):
+    connector = FakeConnector(TABLES)
+    calls = []
+
+    async def search_in_database_multi(terms, limit):
+        calls.append(terms)
+        return {term: ["CUSTOMER_ARCHIVE"] if term == "CUST" else [] for term in terms}
+
+    connector.search_in_database_multi = search_in_database_multi
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+
+    result = await manager.search_tables_multi(["ord", "cust", "ORD"], limit=3)
+    assert result == ["ORDERS", "CUSTOMERS", "CUSTOMER_ARCHIVE"]
+    assert calls == [["ORD", "CUST"]]
+    assert "CUSTOMER_ARCHIVE" in manager.cache.all_table_names
+
+    # Once the index fills the limit, later terms aren't searched
+    calls.clear()
+    assert await manager.search_tables_multi(["ord", "cust"], limit=1) == ["ORDERS"]
+    assert calls == []
+    await manager.close()
+
+
+async def test_search_columns_merges_loaded_and_database_tables_in_name_order(tmp_path: Path):
+    tables = {
+        "ORDERS": [{"name": "CUSTOMER_ID", "type": "NUMBER(10,2)", "nullable": True}],
+        "CUSTOMERS": [{"name": "CUSTOMER_ID", "type": "VARCHAR2(100)", "nullable": False}],
+    }
+    connector = FakeConnector(tables)
+    calls = []
+
+    async def search_columns_in_database(term, limit):
+        # The database sees every table, loaded or not, in name order
+        calls.append(term)
+        return {
+            "CUSTOMERS": [Column("CUSTOMER_ID", "VARCHAR2(100)", False)],
+            "ORDERS": [Column("CUSTOMER_ID", "NUMBER(10,2)", True)],
+        }
+
+    connector.search_columns_in_database = search_columns_in_database
+    manager = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await manager.initialize()
+    await manager.get_schema_info("ORDERS")
+
+    result = await manager.search_columns("customer")
+    assert list(result) == ["CUSTOMERS", "ORDERS"]
+    assert result["CUSTOMERS"] == [Column("CUSTOMER_ID", "VARCHAR2(100)", False)]
+    # The loaded table reads the same as the one found in the database
+    assert result["ORDERS"] == [Column("CUSTOMER_ID", "NUMBER(10,2)", True)]
+    assert list(await manager.search_columns("customer", limit=1)) == ["CUSTOMERS"]
+
+    # With every table loaded the index answers on its own
+    await manager.get_schema_info("CUSTOMERS")
+    calls.clear()
+    assert await manager.search_columns("customer") == result
+    assert calls == []
+    await manager.close()
+
+
+async def test_cache_from_older_format_is_rebuilt(tmp_path: Path):
+    manager = SchemaManager(FakeConnector(TABLES), tmp_path / "schema_cache.json")
+    await manager.initialize()
+    await manager.get_schema_info("CUSTOMERS")
+    await manager.close()
+    with sqlite3.connect(manager.cache_path) as db:
+        db.execute("DELETE FROM meta WHERE key = 'format_version'")
+
+    connector = FakeConnector(TABLES)
+    reloaded = SchemaManager(connector, tmp_path / "schema_cache.json")
+    await reloaded.initialize()
+    assert (await reloaded.get_schema_info("CUSTOMERS")).fully_loaded
+    assert connector.detail_loads == ["CUSTOMERS"]
+    await reloaded.close()
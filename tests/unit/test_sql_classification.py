@@ -40,3 +40,47 @@ def test_is_select_query(sql, expected):
 ])
 def test_is_write_operation(sql, expected):
     assert DatabaseConnector._is_write_operation(sql) is expected
+
+# Inputs around the keyword fast path, with the answers sqlparse gives
+@pytest.mark.parametrize("sql,is_select,is_write", [
+    ("-- note\nSELECT 1 FROM dual", True, False),
+    ("--c\rDELETE FROM t\nSELECT 1", False, True),
+    ("/* x */ DELETE FROM t /* y */ SELECT 1", False, True),
+    ("/* a */ GRANT/* b */\nSELECT 1", False, True),
+    ("SELECT 1\nGO\nDELETE FROM t", False, False),
+    ("SELECT(1) FROM dual", False, False),
+])
+def test_fast_path_agrees_with_sqlparse(sql, is_select, is_write):
+    assert DatabaseConnector._is_select_query(sql) is is_select
+    assert DatabaseConnector._is_write_operation(sql) is is_write
+
+
+def test_parsed_statements_are_classified_once(monkeypatch):
+    from db_context import database
+
+    calls = []
+    real_parse = sqlparse.parse
+    monkeypatch.setattr(sqlparse, "parse", lambda sql: calls.append(sql) or real_parse(sql))
+    database._classify_statement.cache_clear()
+
+    sql = "BEGIN NULL; END;"
+    assert DatabaseConnector._is_select_query(sql) is False
+    assert DatabaseConnector._is_write_operation(sql) is False
+    assert DatabaseConnector._is_select_query(sql) is False
+    assert calls == [sql]
+
+
+@pytest.mark.parametrize("sql,is_select,is_write", [
+    ("SELECT 1 FROM dual;", True, False),
+    ("DELETE FROM t;\n", False, True),
+])
+def test_trailing_semicolon_skips_the_parse(monkeypatch, sql, is_select, is_write):
+    from db_context import database
+
+    def fail(sql):
+        raise AssertionError("sqlparse should not be needed")
+
+    monkeypatch.setattr(sqlparse, "parse", fail)
+    database._classify_statement.cache_clear()
+    assert DatabaseConnector._is_select_query(sql) is is_select
+    assert DatabaseConnector._is_write_operation(sql) is is_write
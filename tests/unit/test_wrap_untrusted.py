@@ -1,6 +1,9 @@
 import re
 from db_context.utils import wrap_untrusted
 
+OPEN_TAG_RE = re.compile(r"<untrusted-data-([0-9a-f-]+)>")
+CLOSE_TAG_RE = re.compile(r"</untrusted-data-([0-9a-f-]+)>")
+
 
 def test_wrap_untrusted_basic():
     data = "Hello World"
@@ -8,9 +11,9 @@ def test_wrap_untrusted_basic():
     assert "Hello World" in wrapped
     assert "<untrusted-data-" in wrapped
     # Appears multiple times (intro, opening tag, closing tag); ensure at least one and all share same UUID
-    occurrences = re.findall(r"<untrusted-data-([0-9a-f-]+)>", wrapped)
+    occurrences = OPEN_TAG_RE.findall(wrapped)
     assert occurrences, "No untrusted-data opening tags found"
-    closing = re.findall(r"</untrusted-data-([0-9a-f-]+)>", wrapped)
+    closing = CLOSE_TAG_RE.findall(wrapped)
     assert closing, "No closing tag found"
     # All UUIDs should match the first one
     first = occurrences[0]
@@ -28,6 +31,14 @@ def test_wrap_untrusted_escapes_angle_brackets():
 def test_wrap_untrusted_unique_ids():
     w1 = wrap_untrusted("one")
     w2 = wrap_untrusted("two")
-    id1 = re.search(r"<untrusted-data-([0-9a-f-]+)>", w1).group(1)
-    id2 = re.search(r"<untrusted-data-([0-9a-f-]+)>", w2).group(1)
+    id1 = OPEN_TAG_RE.search(w1).group(1)
+    id2 = OPEN_TAG_RE.search(w2).group(1)
     assert id1 != id2
+
+
+def test_wrap_untrusted_matches_template():
+    from db_context.utils import _WRAP_TEMPLATE
+
+    wrapped = wrap_untrusted("a <b> c")
+    uid = OPEN_TAG_RE.search(wrapped).group(1)
+    assert wrapped == _WRAP_TEMPLATE.format(uid=uid, body="a &lt;b&gt; c")